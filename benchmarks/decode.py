@@ -0,0 +1,197 @@
+"""Micro-benchmark of update decoding throughput (raw JSON -> TlObject)
+
+``baseline`` swaps the generated ``from_dict`` methods for the previous ones, which built objects with ``cls()``
+(``__init__`` stored every default, then ``from_dict`` overwrote all of them).
+``single-pass`` uses the generated ``from_dict`` methods, which build objects with ``cls.__new__`` and assign each field once.
+
+Usage: python benchmarks/decode.py [--mode {baseline,single-pass,both}] [--iterations N] [--repeat N]
+"""
+
+import argparse
+import json
+import sys
+from base64 import b64decode
+from collections.abc import Callable
+from pathlib import Path
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from generate_files import generate_from_dict_kwargs, to_camel_case  # noqa: E402
+from pytdbot import types  # noqa: E402
+from pytdbot.utils import ObjDecoder, dict_to_obj, json_dumps, json_loads  # noqa: E402
+
+baseline_template = """def from_dict(cls, data):
+    if data:
+        data_class = cls()
+        {from_dict_kwargs}
+
+    return data_class"""
+
+text = {
+    "@type": "formattedText",
+    "text": "Hello /start https://example.com @username",
+    "entities": [
+        {
+            "@type": "textEntity",
+            "offset": 6,
+            "length": 6,
+            "type": {"@type": "textEntityTypeBotCommand"},
+        },
+        {
+            "@type": "textEntity",
+            "offset": 13,
+            "length": 19,
+            "type": {"@type": "textEntityTypeUrl"},
+        },
+        {
+            "@type": "textEntity",
+            "offset": 33,
+            "length": 9,
+            "type": {"@type": "textEntityTypeMention"},
+        },
+    ],
+}
+
+message = {
+    "@type": "message",
+    "id": 1048576,
+    "sender_id": {"@type": "messageSenderUser", "user_id": 123456789},
+    "chat_id": -1001234567890,
+    "is_outgoing": False,
+    "can_be_saved": True,
+    "date": 1700000000,
+    "interaction_info": {
+        "@type": "messageInteractionInfo",
+        "view_count": 1200,
+        "forward_count": 3,
+    },
+    "unread_reactions": [],
+    "reply_to": {
+        "@type": "messageReplyToMessage",
+        "chat_id": -1001234567890,
+        "message_id": 1047552,
+    },
+    "content": {
+        "@type": "messageText",
+        "text": text,
+        "link_preview_options": {
+            "@type": "linkPreviewOptions",
+            "is_disabled": True,
+            "url": "",
+        },
+    },
+    "reply_markup": {
+        "@type": "replyMarkupInlineKeyboard",
+        "rows": [
+            [
+                {
+                    "@type": "inlineKeyboardButton",
+                    "text": f"Button {row}.{column}",
+                    "type": {
+                        "@type": "inlineKeyboardButtonTypeCallback",
+                        "data": "YWN0aW9u",
+                    },
+                }
+                for column in range(3)
+            ]
+            for row in range(2)
+        ],
+    },
+}
+
+samples = {
+    "updateNewMessage": {"@type": "updateNewMessage", "message": message},
+    "updateUserStatus": {
+        "@type": "updateUserStatus",
+        "user_id": 123456789,
+        "status": {"@type": "userStatusOnline", "expires": 1700000300},
+    },
+    "updateChatReadInbox": {
+        "@type": "updateChatReadInbox",
+        "chat_id": -1001234567890,
+        "last_read_inbox_message_id": 1048576,
+        "unread_count": 0,
+    },
+}
+
+
+def use_baseline_from_dict() -> None:
+    r"""Replace the generated ``from_dict`` of every type with the ``cls()`` based one"""
+
+    with open(ROOT / "td_api.json", encoding="utf-8") as f:
+        tl_json = json.load(f)
+
+    for type_name, type_data in {**tl_json["types"], **tl_json["updates"]}.items():
+        from_dict_kwargs = (
+            generate_from_dict_kwargs(type_data["args"])
+            .removeprefix("get = data.get; ")
+            .replace('get("', 'data.get("')
+        )
+        namespace = {"b64decode": b64decode}
+        exec(  # noqa: S102
+            baseline_template.format(from_dict_kwargs=from_dict_kwargs or "pass"),
+            namespace,
+        )
+
+        obj_type = getattr(types, to_camel_case(type_name, is_class=True))
+        obj_type.from_dict = classmethod(namespace["from_dict"])
+
+
+def best_of(repeat: int, func: Callable[[], float]) -> float:
+    return max(func() for _ in range(repeat))
+
+
+def bench(raw: bytes, lazy: bool, iterations: int) -> float:
+    start = perf_counter()
+    for _ in range(iterations):
+        dict_to_obj(json_loads(raw), None, lazy)
+    return iterations / (perf_counter() - start)
+
+
+def bench_fast(raw: bytes, iterations: int) -> float:
+    decode = ObjDecoder().decode
+    to_obj = ObjDecoder.to_obj
+
+    start = perf_counter()
+    for _ in range(iterations):
+        to_obj(decode(raw))
+    return iterations / (perf_counter() - start)
+
+
+def run(mode: str, iterations: int, repeat: int) -> None:
+    for name, sample in samples.items():
+        raw = json_dumps({**sample, "@client_id": 1}, encode=True)
+        bench(raw, False, iterations // 10)  # warm up
+
+        eager = best_of(repeat, lambda: bench(raw, False, iterations))
+        lazy = best_of(repeat, lambda: bench(raw, True, iterations))
+        fast = best_of(repeat, lambda: bench_fast(raw, iterations))
+        print(
+            f"{mode:<12} {name:<22} eager: {eager:>10,.0f}/s"
+            f"  lazy: {lazy:>10,.0f}/s  fast: {fast:>10,.0f}/s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--mode", choices=("baseline", "single-pass", "both"), default="both"
+    )
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="report the best of this many runs"
+    )
+    args = parser.parse_args()
+
+    if args.mode in {"single-pass", "both"}:
+        run("single-pass", args.iterations, args.repeat)
+
+    if args.mode in {"baseline", "both"}:
+        use_baseline_from_dict()
+        run("baseline", args.iterations, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -181,6 +181,18 @@ def generate_self_args(args, classes):
     return f"\n{indent * 2}".join(args_list)
 
 
+def generate_slots(args):
+    slots = []
+    for arg_name in args.keys():
+        if arg_name in keyword.kwlist:
+            arg_name += "_"
+        slots.append(f'"{arg_name}"')
+
+    slots += ['"_client"', '"_lazy_fields"']
+
+    return ", ".join(slots)
+
+
 def generate_to_dict_return(args):
     args_list = ['"@type": self.getType()']
     for arg_name, _ in args.items():
@@ -201,15 +213,18 @@ def generate_from_dict_kwargs(args):
 
         if arg_type == "bytes":
             args_list.append(
-                f'data_class.{arg_name} = b64decode(data.get("{arg_name}", b""))'
+                f'data_class.{arg_name} = b64decode(get("{arg_name}", b""))'
             )
         elif arg_type == "int":  # Some values are int but in string format
-            args_list.append(f'data_class.{arg_name} = int(data.get("{arg_name}", 0))')
+            args_list.append(f'data_class.{arg_name} = int(get("{arg_name}", 0))')
         else:
             args_list.append(
-                f'data_class.{arg_name} = data.get("{arg_name}", {generate_arg_default(arg_type)})'
+                f'data_class.{arg_name} = get("{arg_name}", {generate_arg_default(arg_type)})'
             )
 
+    if args_list:
+        args_list.insert(0, "get = data.get")
+
     return "; ".join(args_list)
 
 
@@ -247,7 +262,7 @@ def generate_inherited_class(class_name, type_data, classes):
 class_template = """class {class_name}{inherited_class}:
     r\"\"\"{docstring}\"\"\"
 
-    pass"""
+    __slots__ = ()"""
 
 
 def generate_classes(f, classes):
@@ -271,6 +286,8 @@ types_template = """class {class_name}({inherited_class}):
 {docstring_args}
     \"\"\"
 
+    __slots__ = ({slots})
+
     def __init__({init_args}) -> None:
         {self_args}
 
@@ -294,7 +311,7 @@ types_template = """class {class_name}({inherited_class}):
     @classmethod
     def from_dict(cls, data: dict) -> {class_name} | None:
         if data:
-            data_class = cls()
+            data_class = cls.__new__(cls)
             {from_dict_kwargs}
 
         return data_class"""
@@ -305,6 +322,7 @@ def generate_types(f, types, updates, classes):
         for type_name, type_data in t.items():
             args_def = generate_args_def(type_data["args"], classes)
             self_args = generate_self_args(type_data["args"], classes)
+            slots = generate_slots(type_data["args"])
             to_return_dict = generate_to_dict_return(type_data["args"])
             from_dict_kwargs = generate_from_dict_kwargs(type_data["args"])
             class_name = to_camel_case(type_name, is_class=True)
@@ -318,6 +336,7 @@ def generate_types(f, types, updates, classes):
                     class_type_name=type_data["type"],
                     docstring=escape_quotes(type_data["description"]),
                     docstring_args=generate_function_docstring_args(type_data),
+                    slots=slots,
                     init_args=args_def,
                     self_args=self_args,
                     type_name=type_name,
@@ -331,6 +350,13 @@ def generate_types(f, types, updates, classes):
     gen(updates)
 
 
+def generate_types_table(f, types, updates):
+    f.write("TL_TYPES: dict[str, type[TlObject]] = {\n")
+    for type_name in (*types, *updates):
+        f.write(f'{indent}"{type_name}": {to_camel_case(type_name, is_class=True)},\n')
+    f.write("}\n")
+
+
 functions_template = """async def {function_name}({function_args}) -> pytdbot.types.Error | pytdbot.types.{return_type}:
         r\"\"\"{docstring}
 {docstring_args}
@@ -366,6 +392,7 @@ updates_template = """    def on_{update_name}(
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r\"\"\"{description}
 
@@ -379,6 +406,9 @@ updates_template = """    def on_{update_name}(
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         \"\"\"
@@ -388,13 +418,13 @@ updates_template = """    def on_{update_name}(
                 return func
             elif isinstance(self, pytdbot.Client):
                 if iscoroutinefunction(func):
-                    self.add_handler(update_type="{update_name}", func=func, filters=filters, position=position, inner_object=False, timeout=timeout)
+                    self.add_handler(update_type="{update_name}", func=func, filters=filters, position=position, inner_object=False, timeout=timeout, concurrent=concurrent)
                 else:
                     raise TypeError("Handler must be async")
             elif isinstance(self, pytdbot.filters.Filter):
-                func._handler = Handler(func=func, update_type="{update_name}", filter=self, position=position, inner_object=False, timeout=timeout)
+                func._handler = Handler(func=func, update_type="{update_name}", filter=self, position=position, inner_object=False, timeout=timeout, concurrent=concurrent)
             else:
-                func._handler = Handler(func=func, update_type="{update_name}", filter=filters, position=position, inner_object=False, timeout=timeout)
+                func._handler = Handler(func=func, update_type="{update_name}", filter=filters, position=position, inner_object=False, timeout=timeout, concurrent=concurrent)
             return func
 
         return decorator
@@ -428,14 +458,34 @@ if __name__ == "__main__":
             """class TlObject:
     \"\"\"Base class for TL Objects\"\"\"
 
+    __slots__ = ()
+
     def __getitem__(self, item):
         if item == "@type":
             return self.getType()
 
-        return self.__dict__[item]
+        try:
+            return getattr(self, item)
+        except AttributeError:
+            raise KeyError(item) from None
 
     def __setitem__(self, item, value):
-        self.__dict__[item] = value
+        setattr(self, item, value)
+
+    def __getattr__(self, name):
+        # Fields left raw by lazy decoding are decoded on first access
+        if name != "_lazy_fields":
+            lazy_fields = getattr(self, "_lazy_fields", None)
+            if lazy_fields and name in lazy_fields:
+                value = pytdbot.utils.dict_to_obj(
+                    lazy_fields.pop(name), getattr(self, "_client", None), lazy=True
+                )
+                setattr(self, name, value)
+                return value
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     def __bool__(self):
         return not isinstance(self, Error)
@@ -471,6 +521,7 @@ if __name__ == "__main__":
         generate_types(
             types_file, tl_json["types"], tl_json["updates"], tl_json["classes"]
         )
+        generate_types_table(types_file, tl_json["types"], tl_json["updates"])
 
     with open("pytdbot/types/__init__.py", "w", encoding="utf-8") as types_init_file:
         types_names = [
@@ -480,13 +531,13 @@ if __name__ == "__main__":
         ]
 
         all_classes = (
-            '__all__ = ["TlObject", "Plugins", "ServerStats", "ScheduledEvent", "UpdateScheduledEvent", '
+            '__all__ = ["TlObject", "TL_TYPES", "Plugins", "ServerStats", "ScheduledEvent", "UpdateScheduledEvent", '
             + ", ".join(f'"{name}"' for name in types_names)
             + "]\n\n"
         )
         types_init_file.write(all_classes)
 
-        classes_import = f"from .td_types import TlObject, {', '.join(types_names)}\nfrom .plugins import Plugins\nfrom .tdserver import ServerStats, ScheduledEvent, UpdateScheduledEvent"
+        classes_import = f"from .td_types import TlObject, TL_TYPES, {', '.join(types_names)}\nfrom .plugins import Plugins\nfrom .tdserver import ServerStats, ScheduledEvent, UpdateScheduledEvent"
         types_init_file.write(classes_import)
         types_init_file.write('\n\nTDLIB_VERSION = "{}"'.format(tl_json["version"]))
 
@@ -3,15 +3,20 @@ from __future__ import annotations
 import asyncio
 import signal
 import sys
-from collections.abc import Callable
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from functools import partial
 from importlib import import_module
 from importlib import reload as reload_module
 from inspect import iscoroutinefunction
+from itertools import count
 from logging import DEBUG, getLogger
 from os.path import join as join_path
 from pathlib import Path
 from platform import python_implementation, python_version
 from threading import current_thread, main_thread
+from time import perf_counter
+from weakref import WeakKeyDictionary
 
 try:
     import nats
@@ -27,9 +32,17 @@ from .client_manager import ClientManager
 from .exception import AuthorizationError, StopHandlers
 from .filters import Filter
 from .handlers import Decorators, Handler
+from .handlers.router import get_routers
 from .methods import Methods
 from .types import LogStream, Plugins
 from .utils import (
+    LanesQueue,
+    Metrics,
+    ObjDecoder,
+    ObjectCache,
+    SendBatch,
+    SendScheduler,
+    UpdatesQueue,
     create_extra_id,
     dict_to_obj,
     get_bot_id_from_token,
@@ -37,8 +50,60 @@ from .utils import (
     json_loads,
     obj_to_dict,
     obj_to_json,
+    timeout_at,
 )
 
+COALESCED_METHODS = {
+    "getBasicGroup",
+    "getBasicGroupFullInfo",
+    "getChat",
+    "getChatMember",
+    "getMe",
+    "getMessage",
+    "getSupergroup",
+    "getSupergroupFullInfo",
+    "getUser",
+    "getUserFullInfo",
+}
+
+# method: (cache key type, request field of object ID)
+CACHED_METHODS = {
+    "getChat": ("chat", "chat_id"),
+    "getUser": ("user", "user_id"),
+    "getSupergroup": ("supergroup", "supergroup_id"),
+    "getBasicGroup": ("basicGroup", "basic_group_id"),
+}
+
+# update type: field of the full object
+OBJECT_CACHE_UPDATES = {
+    "updateNewChat": "chat",
+    "updateUser": "user",
+    "updateSupergroup": "supergroup",
+    "updateBasicGroup": "basic_group",
+}
+
+# updates that change a chat but can't be applied field by field
+CHAT_INVALIDATING_UPDATES = {
+    "updateChatPosition",
+    "updateChatAddedToList",
+    "updateChatRemovedFromList",
+    "updateChatReplyMarkup",
+    "updateMessageMentionRead",
+    "updateMessageUnreadReactions",
+}
+
+# updateChat* updates that don't change the chat object
+CHAT_IGNORED_UPDATES = {
+    "updateChatAction",
+    "updateChatActiveStories",
+    "updateChatBoost",
+    "updateChatFolders",
+    "updateChatJoinResult",
+    "updateChatMember",
+    "updateChatOnlineMemberCount",
+    "updateChatRevenueAmount",
+}
+
 
 class Client(Decorators, Methods):
     r"""Pytdbot, a TDLib client
@@ -69,6 +134,18 @@ class Client(Decorators, Methods):
             The default ``parse_mode`` for methods: :meth:`~pytdbot.Client.sendTextMessage`, :meth:`~pytdbot.Client.sendPhoto`, :meth:`~pytdbot.Client.sendAudio`, :meth:`~pytdbot.Client.sendVideo`, :meth:`~pytdbot.Client.sendDocument`, :meth:`~pytdbot.Client.sendAnimation`, :meth:`~pytdbot.Client.sendVoice`, :meth:`~pytdbot.Client.sendCopy`, :meth:`~pytdbot.Client.editTextMessage`; Default is ``None`` (Don\'t parse)
             Supported values: ``markdown``, ``markdownv2``, ``html``
 
+        local_text_parsing (``bool``, *optional*):
+            Parse ``html`` and ``markdownv2`` texts of :meth:`~pytdbot.Client.parseText` (and so ``parse_mode`` of the send methods) in Python
+            with :func:`~pytdbot.utils.parse_html` and :func:`~pytdbot.utils.parse_markdown_v2` instead of a ``parseTextEntities`` request.
+            Texts the local parsers can't handle exactly like TDLib, and invalid texts, are still parsed by TDLib. Default is ``False``
+
+        parse_cache_size (``int``, *optional*):
+            Max number of :meth:`~pytdbot.Client.parseText` results to cache by text and parse mode, so repeated texts are parsed once.
+            Cached results are shared between callers. Hits and misses are counted by :attr:`parse_cache`. Default is ``0`` (disabled)
+
+        parse_cache_max_bytes (``int``, *optional*):
+            Approximate max memory used by the cached parse results. Default is ``8388608`` (8 MiB)
+
         system_language_code (``str``, *optional*):
             System language code. Default is ``en``
 
@@ -99,9 +176,56 @@ class Client(Decorators, Methods):
         workers (``int``, *optional*):
             Number of workers to handle updates. Default is ``5``. If set to ``None``, updates will be immediately handled instead of being queued, which can impact performance.
 
+        queue_size (``int``, *optional*):
+            Max number of updates waiting for workers. If ``0``, the queue is unbounded. Default is ``1000``
+
+        queue_overflow (``str``, *optional*):
+            What to do with new updates when the queue is full. Default is ``block``
+            Supported values: ``block`` (stop receiving updates from TDLib until there is a free slot; results of pending requests are still received), ``drop_oldest``, ``drop_newest``, ``drop_by_type`` (drop by ``queue_shed_types``, else wait)
+
+        queue_shed_types (``list[str]``, *optional*):
+            Update types that can be dropped when ``queue_overflow`` is ``drop_by_type``, the first ones are dropped first; for example ``["updateUserStatus", "updateChatReadInbox"]``
+
+        dispatch_mode (``str``, *optional*):
+            How queued updates are handed to workers. Default is ``shared``
+            Supported values: ``shared`` (any worker takes the next update), ``per_chat`` (updates of the same chat, user or query are handled in order, one at a time, while different chats are handled concurrently). See :meth:`~pytdbot.Client.get_update_key`
+
         default_handlers_timeout (``float``, *optional*):
             Default timeout for handlers. If set, each handler will be awaited with this timeout (ignored if ``timeout`` is set when registering handler). Default is ``None`` (no timeout)
 
+        update_timeout (``float``, *optional*):
+            Max time for all initializers and handlers of an update. When it's exceeded, the running handler is cancelled and the remaining ones are skipped; finalizers still run. Default is ``None`` (no limit)
+
+        lazy_decoding (``bool``, *optional*):
+            If set to true, nested objects of updates and results are decoded on first access instead of upfront. Default is ``False``
+
+        fast_decoding (``bool``, *optional*):
+            If set to true, updates and results are decoded straight from TDLib JSON into objects in a single pass, see :class:`~pytdbot.utils.ObjDecoder`. Takes precedence over ``lazy_decoding``; not used with NATS. Default is ``False``
+
+        coalesce_requests (``bool`` | ``list[str]``, *optional*):
+            If set, concurrent identical requests of idempotent getters share one TDLib request and get the same result object.
+            Pass ``True`` to use the default methods (``getChat``, ``getUser``, ``getSupergroup``, ``getMessage``, etc.) or a list of method names. Default is ``False``
+
+        object_cache_size (``int``, *optional*):
+            Max number of chats, users, supergroups and basic groups cached by the client, see :class:`~pytdbot.utils.ObjectCache`.
+            The cache is kept up to date by updates, and :meth:`~pytdbot.Client.getChat`, :meth:`~pytdbot.Client.getUser`, :meth:`~pytdbot.Client.getSupergroup` and :meth:`~pytdbot.Client.getBasicGroup` are answered from it without a TDLib request.
+            Cached objects are shared between callers. Not used with NATS, where each instance only gets some of the updates. Default is ``0`` (disabled)
+
+        object_cache_ttl (``float``, *optional*):
+            Seconds after which a cached object expires. Default is ``None`` (never)
+
+        enable_metrics (``bool``, *optional*):
+            Collect per-handler latency, error and throughput metrics, queue wait time and per-method TDLib request latency, in-flight and error metrics, see :meth:`~pytdbot.Client.metrics`. Default is ``False``
+
+        slow_request_threshold (``float`` | ``dict[str, float]``, *optional*):
+            Log a warning for TDLib requests whose result takes longer than this many seconds.
+            A ``dict`` sets the threshold per method, e.g. ``{"sendMessage": 1.0, "getChat": 0.2}``. Default is ``None`` (disabled)
+
+        rate_limit (``bool`` | :class:`~pytdbot.utils.SendScheduler`, *optional*):
+            Pace ``sendMessage``, ``sendMessageAlbum``, ``forwardMessages``, ``resendMessages`` and ``sendInlineQueryResultMessage`` requests
+            with per-chat and global token buckets matching Telegram limits, and send again messages failed with ``429 Too Many Requests`` after the returned retry-after time.
+            Other chats are not delayed by a limited chat. Pass a :class:`~pytdbot.utils.SendScheduler` to change the limits. Default is ``False``
+
         no_updates (``bool``, *optional*):
             Whether the client should handle updates or not. Applicable only when using [TDLib Server](https://github.com/pytdbot/tdlib-server). Default is ``False``
 
@@ -115,6 +239,13 @@ class Client(Decorators, Methods):
             Pass ``True`` if this is a user-bot. Default is ``False``
     """
 
+    LOADED_MESSAGES_SIZE = 100000  # max number of remembered loaded messages
+    NOT_FOUND_TTL = 60.0  # seconds before loading a missing chat or message again
+    SEND_BATCH_TIMEOUT = (
+        300.0  # seconds to wait for the messages of sendAlbum to be sent
+    )
+    SENT_MESSAGES_TTL = 60.0  # seconds to remember sent messages for wait_messages_sent
+
     def __init__(
         self,
         token: str | None = None,
@@ -125,6 +256,9 @@ class Client(Decorators, Methods):
         lib_path: str | None = None,
         plugins: Plugins | None = None,
         default_parse_mode: str | None = None,
+        local_text_parsing: bool = False,
+        parse_cache_size: int = 0,
+        parse_cache_max_bytes: int = 8 * 1024 * 1024,
         system_language_code: str = "en",
         device_model: str | None = None,
         files_directory: str | None = None,
@@ -136,7 +270,19 @@ class Client(Decorators, Methods):
         options: dict | None = None,
         workers: int = 5,
         queue_size: int = 1000,
+        queue_overflow: str = "block",
+        queue_shed_types: list[str] | None = None,
+        dispatch_mode: str = "shared",
         default_handlers_timeout: float | None = None,
+        update_timeout: float | None = None,
+        lazy_decoding: bool = False,
+        fast_decoding: bool = False,
+        coalesce_requests: bool | list[str] = False,
+        object_cache_size: int = 0,
+        object_cache_ttl: float | None = None,
+        enable_metrics: bool = False,
+        slow_request_threshold: float | dict[str, float] | None = None,
+        rate_limit: bool | SendScheduler = False,
         no_updates: bool = False,
         load_messages_before_reply: bool = False,
         td_verbosity: int = 2,
@@ -160,6 +306,12 @@ class Client(Decorators, Methods):
             and default_parse_mode.lower() in {"markdown", "markdownv2", "html"}
             else None
         )
+        self.local_text_parsing = local_text_parsing
+        self.parse_cache = (
+            ObjectCache(parse_cache_size, max_bytes=parse_cache_max_bytes)
+            if isinstance(parse_cache_size, int) and parse_cache_size > 0
+            else None
+        )
         self.system_language_code = system_language_code
         self.device_model = device_model
         self.use_test_dc = use_test_dc
@@ -170,9 +322,47 @@ class Client(Decorators, Methods):
         self.workers = workers
         self.queue_size = queue_size
         self.default_handlers_timeout = default_handlers_timeout
+        self.update_timeout = update_timeout
+        self.lazy_decoding = lazy_decoding
+        self.fast_decoding = fast_decoding
+        self.coalesce_methods = (
+            COALESCED_METHODS
+            if coalesce_requests is True
+            else set(coalesce_requests or ())
+        )
+        self.object_cache = (
+            ObjectCache(object_cache_size, object_cache_ttl)
+            if isinstance(object_cache_size, int)
+            and object_cache_size > 0
+            and not nats_url  # each instance only gets some of the updates
+            else None
+        )
         self.no_updates = no_updates
         self.load_messages_before_reply = load_messages_before_reply
-        self.queue = asyncio.Queue()
+        self.dispatch_mode = dispatch_mode
+        self._metrics = Metrics() if enable_metrics else None
+        self.slow_request_threshold = slow_request_threshold
+        self.__track_requests = enable_metrics or slow_request_threshold is not None
+        self.send_scheduler = (
+            rate_limit
+            if isinstance(rate_limit, SendScheduler)
+            else SendScheduler()
+            if rate_limit
+            else None
+        )
+        self.queue = (
+            LanesQueue(
+                self.get_update_key,
+                queue_size,
+                queue_overflow,
+                queue_shed_types,
+                enable_metrics,
+            )
+            if dispatch_mode == "per_chat"
+            else UpdatesQueue(
+                queue_size, queue_overflow, queue_shed_types, enable_metrics
+            )
+        )
         self.user_bot = user_bot
         self.my_id = (
             get_bot_id_from_token(self.__token)
@@ -203,8 +393,27 @@ class Client(Decorators, Methods):
 
         self._handlers = {"initializer": [], "finalizer": []}
         self._current_handlers = {}
-        self._results: dict[str, asyncio.Future] = {}
+        self._routers = {}
+        self._results: dict[int | str, asyncio.Future] = {}
+        self._send_batches: dict[int, list[SendBatch]] = {}
+        self._broadcast_schedulers: list[SendScheduler] = []
+        self.__request_ids = count(1)
+        self.__in_flight: dict[frozenset, asyncio.Future] = {}
+        self.__flood_retries: WeakKeyDictionary[asyncio.Future, int] = (
+            WeakKeyDictionary()
+        )  # resends of a flood-limited message, by its send future
+        self.__patch_fields: dict[str, tuple[str, ...]] = {}
+        self.__metrics_server: asyncio.AbstractServer | None = None
+        self.__loaded_messages = ObjectCache(self.LOADED_MESSAGES_SIZE)
+        self.__not_found = ObjectCache(self.LOADED_MESSAGES_SIZE, self.NOT_FOUND_TTL)
+        self.__sent_messages = ObjectCache(
+            self.LOADED_MESSAGES_SIZE, self.SENT_MESSAGES_TTL
+        )  # messages sent or failed before wait_messages_sent was called
         self._workers_tasks = None
+        self.__intake: deque[tuple[float | None, types.TlObject]] = (
+            deque()
+        )  # (arrival time, update) waiting for a free slot of the queue
+        self.__intake_event: asyncio.Event = None
         self.__wait_login: asyncio.Event = None
         self.__authorization_state: str = None
         self.__cache = {"is_coro_filter": {}}
@@ -212,6 +421,7 @@ class Client(Decorators, Methods):
             "updateAuthorizationState": self.__handle_authorization_state,
             "updateMessageSendSucceeded": self.__handle_update_message_succeeded,
             "updateMessageSendFailed": self.__handle_update_message_failed,
+            "updateDeleteMessages": self.__handle_update_delete_messages,
             "updateConnectionState": self.__handle_connection_state,
             "updateOption": self.__handle_update_option,
             "updateUser": self.__handle_update_user,
@@ -333,7 +543,11 @@ class Client(Decorators, Methods):
                 self.__wait_login = asyncio.Event() if not self.user_bot else None
 
                 self.client_manager = ClientManager(
-                    self, self.lib_path, self.td_verbosity, loop=self.loop
+                    self,
+                    self.lib_path,
+                    self.td_verbosity,
+                    loop=self.loop,
+                    fast_decoding=self.fast_decoding,
                 )
                 await self.client_manager.start()
                 self.is_running = True
@@ -344,10 +558,14 @@ class Client(Decorators, Methods):
                 )
 
             if isinstance(self.workers, int) and not self.is_nats:
+                self.__intake_event = asyncio.Event()
                 self._workers_tasks = [
                     self.loop.create_task(self._queue_update_worker())
                     for _ in range(self.workers)
                 ]
+                self._workers_tasks.append(
+                    self.loop.create_task(self.__queue_intake_worker())
+                )
                 self.__is_queue_worker = True
 
                 self.logger.info(f"Started with {self.workers} workers")
@@ -371,6 +589,7 @@ class Client(Decorators, Methods):
         inner_object: bool = False,
         timeout: float | None = None,
         is_from_plugin: bool = False,
+        concurrent: bool = False,
     ) -> None:
         r"""Add an update handler
 
@@ -396,6 +615,12 @@ class Client(Decorators, Methods):
             is_from_plugin (``bool``, *optional*):
                 Wether this handler is from a loaded plugin (this can help reloading plugin during runtime; for development only). Default is ``False``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers of the update. Concurrent handlers are started in order
+                without waiting for them to finish and run concurrently with the next handlers; all of them finish before finalizers run.
+                :class:`~pytdbot.exception.StopHandlers` raised by a concurrent handler doesn't stop the other handlers.
+                Ignored for initializers and finalizers. Default is ``False``
+
         Raises:
             TypeError
         """
@@ -420,6 +645,7 @@ class Client(Decorators, Methods):
             inner_object=inner_object,
             timeout=timeout,
             is_from_plugin=is_from_plugin,
+            concurrent=concurrent,
         )
 
         if update_type not in self._handlers:
@@ -479,6 +705,87 @@ class Client(Decorators, Methods):
             self._update_handlers()
         return removed
 
+    def metrics(self) -> dict | None:
+        r"""Get a snapshot of the client metrics. Requires ``enable_metrics``
+
+        Example:
+            .. code-block:: python
+
+                for handler in client.metrics()["handlers"]:
+                    print(handler["handler"], handler["calls"], handler["handler_time"]["p99"])
+
+        Returns:
+            :py:class:`dict`: ``handlers``: list of per-handler metrics (``calls``, ``filtered_out``, ``exceptions``, ``timeouts``, ``stop_handlers``,
+            ``filter_time`` and ``handler_time`` histograms), ``queue_wait``: queue wait time histogram per update type,
+            ``requests``: per-method TDLib request metrics (``calls``, ``in_flight``, ``errors`` by error code, ``slow`` and ``latency`` histogram),
+            ``send_scheduler``: send queue depth and delay statistics if ``rate_limit`` is enabled.
+            ``None`` if metrics are disabled
+        """
+
+        if self._metrics is None:
+            return None
+
+        snapshot = self._metrics.snapshot()
+        if self.send_scheduler is not None:
+            snapshot["send_scheduler"] = self.send_scheduler.snapshot()
+
+        return snapshot
+
+    async def start_metrics_server(
+        self, host: str = "127.0.0.1", port: int = 9464
+    ) -> None:
+        r"""Serve the client metrics in Prometheus text format at ``GET /metrics``. Requires ``enable_metrics``.
+        The server is closed when the client stops
+
+        Parameters:
+            host (``str``, *optional*):
+                Host to listen on. Default is ``127.0.0.1``
+
+            port (``int``, *optional*):
+                Port to listen on. Default is ``9464``
+
+        Raises:
+            :py:class:`ValueError`
+        """
+
+        if self._metrics is None:
+            raise ValueError("Metrics are disabled, pass enable_metrics=True")
+
+        if self.__metrics_server is not None:
+            return
+
+        self.__metrics_server = await asyncio.start_server(
+            self.__serve_metrics, host, port
+        )
+        self.logger.info(f"Metrics server is listening on {host}:{port}")
+
+    async def __serve_metrics(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+            method, _, target = request.split(b"\r\n", 1)[0].partition(b" ")
+            path = target.split(b" ", 1)[0].split(b"?", 1)[0]
+
+            if method == b"GET" and path == b"/metrics":
+                status = b"200 OK"
+                body = self._metrics.to_prometheus().encode("utf-8")
+            else:
+                status = b"404 Not Found"
+                body = b"Not Found\n"
+
+            writer.write(
+                b"HTTP/1.1 " + status + b"\r\n"
+                b"Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                b"Content-Length: " + str(len(body)).encode() + b"\r\n"
+                b"Connection: close\r\n\r\n" + body
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, OSError):
+            pass
+        finally:
+            writer.close()
+
     async def invoke(
         self,
         request: dict,
@@ -503,22 +810,247 @@ class Client(Decorators, Methods):
             :class:`~pytdbot.types.Result`
         """
 
-        request = obj_to_dict(request)
-        request["@extra"] = {"id": create_extra_id()}
-        request_method = request["@type"].lower()
+        cache_key = None
+        if (
+            self.object_cache is not None
+            and (cache_key := self.__get_object_cache_key(request)) is not None
+            and (obj := self.object_cache.get(cache_key)) is not None
+        ):
+            return obj
+
+        if (
+            self.coalesce_methods
+            and (key := self.__get_coalesce_key(request)) is not None
+        ):
+            if (in_flight := self.__in_flight.get(key)) is None:
+                in_flight = self.__in_flight[key] = asyncio.ensure_future(
+                    self.__invoke(request)
+                )
+                in_flight.add_done_callback(lambda _: self.__in_flight.pop(key, None))
+
+            # one caller being cancelled must not cancel the others
+            result = await asyncio.shield(in_flight)
+        else:
+            result = await self.__invoke(request)
+
+        if cache_key is not None and not isinstance(result, types.Error):
+            self.object_cache.set(cache_key, result)
+
+        return result
+
+    async def __invoke(self, request: dict) -> types.TlObject:
+        request = self.__prepare_request(request)
+
+        if self.send_scheduler is not None and self.send_scheduler.is_limited(request):
+            return await self.__send_limited(request)
+
+        return await self.__send_and_get_result(request)
+
+    async def __send_limited(self, request: dict) -> types.TlObject:
+        return await self.send_scheduler.run(
+            request["chat_id"],
+            partial(self.__send_and_get_result, request),
+            self.send_scheduler.get_cost(request),
+        )
+
+    async def __send_and_get_result(self, request: dict) -> types.TlObject:
+        future = self._create_request_future(request)
+        await self.__send(request)
+
+        return await self.__get_result(request, future)
+
+    def __get_object_cache_key(self, request: dict) -> tuple | None:
+        if hasattr(request, "to_dict"):
+            request = request.to_dict()
+
+        if cached_method := CACHED_METHODS.get(request.get("@type")):
+            key_type, id_field = cached_method
+            return (key_type, request.get(id_field))
+
+    def __get_coalesce_key(self, request: dict) -> frozenset | None:
+        if hasattr(request, "to_dict"):
+            request = request.to_dict()
+
+        if request.get("@type") not in self.coalesce_methods:
+            return None
+
+        try:
+            return frozenset(request.items())
+        except TypeError:  # unhashable arguments
+            return None
+
+    async def wait_messages_sent(
+        self,
+        messages: types.Messages | list[types.Message],
+        timeout: float | None = None,
+    ) -> types.Messages:
+        r"""Wait until messages returned by a request are sent or failed, e.g. the result of :meth:`~pytdbot.Client.sendMessageAlbum`,
+        :meth:`~pytdbot.Client.forwardMessages` or of many :meth:`~pytdbot.Client.sendMessage` calls.
+        Messages sent or failed before the call are remembered for :attr:`SENT_MESSAGES_TTL` seconds
+
+        Example:
+            .. code-block:: python
+
+                res = await client.forwardMessages(chat_id=chat_id, from_chat_id=from_chat_id, message_ids=message_ids)
+                if not isinstance(res, types.Error):
+                    sent = await client.wait_messages_sent(res, timeout=60)
+
+        Parameters:
+            messages (:class:`~pytdbot.types.Messages` | ``list[Message]``):
+                The messages being sent
+
+            timeout (``float``, *optional*):
+                Max seconds to wait; the messages still being sent are returned as they are. Default is ``None`` (no limit)
+
+        Returns:
+            :class:`~pytdbot.types.Messages`: In the original order. Failed messages have the :class:`~pytdbot.types.MessageSendingStateFailed` sending state
+        """
+
+        batch = SendBatch(messages)
+        for chat_id, message_id in batch.pending:
+            if (sent := self.__sent_messages.pop((chat_id, message_id))) is not None:
+                batch.resolve(chat_id, message_id, *sent)
+
+        if batch.done():
+            return batch.result()
+
+        for chat_id in batch.chat_ids:
+            self._send_batches.setdefault(chat_id, []).append(batch)
+        batch.add_done_callback(self.__remove_send_batch)
+
+        timer = (
+            self.loop.call_later(timeout, batch.expire) if timeout is not None else None
+        )
+        try:
+            return await batch
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    async def invoke_many(self, requests: Iterable[dict]) -> list[types.TlObject]:
+        r"""Invoke many TDLib requests at once
+
+        All requests are encoded and sent back-to-back before waiting for any result
+
+        Example:
+            .. code-block:: python
+
+                from pytdbot import Client
+
+                async with Client(...) as client:
+                    users = await client.invoke_many(
+                        {"@type": "getUser", "user_id": user_id} for user_id in user_ids
+                    )
+
+        Parameters:
+            requests (``Iterable[dict]``):
+                The requests to be sent
+
+        Returns:
+            ``list`` of :class:`~pytdbot.types.Result`: In the same order as ``requests``
+        """
+
+        return await asyncio.gather(*await self.__submit_many(requests))
+
+    async def invoke_iter(
+        self, requests: Iterable[dict], ordered: bool = True
+    ) -> AsyncIterator[types.TlObject]:
+        r"""Invoke many TDLib requests at once and iterate over the results
+
+        All requests are encoded and sent back-to-back before waiting for any result
+
+        Example:
+            .. code-block:: python
+
+                from pytdbot import Client
+
+                async with Client(...) as client:
+                    async for message in client.invoke_iter(
+                        (
+                            {"@type": "getMessage", "chat_id": chat_id, "message_id": message_id}
+                            for message_id in message_ids
+                        ),
+                        ordered=False,
+                    ):
+                        print(message)
+
+        Parameters:
+            requests (``Iterable[dict]``):
+                The requests to be sent
+
+            ordered (``bool``, *optional*):
+                If ``True``, results are yielded in the same order as ``requests``, otherwise as soon as they are received. Default is ``True``
+
+        Returns:
+            :py:class:`~collections.abc.AsyncIterator` of :class:`~pytdbot.types.Result`
+        """
+
+        tasks = await self.__submit_many(requests)
+
+        try:
+            for task in tasks if ordered else asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def __prepare_request(self, request: dict) -> dict:
+        # nested objects are serialized by the JSON encoder while dumping
+        request = request.to_dict() if hasattr(request, "to_dict") else {**request}
+        request["@extra"] = {"id": self._new_request_id()}
 
         if (
             self.logger.root.level >= DEBUG or self.logger.level >= DEBUG
         ):  # dumping all requests may create performance issues
             self.logger.debug(f"Sending: {obj_to_json(request, indent=4)}")
 
+        return request
+
+    async def __submit_many(self, requests: Iterable[dict]) -> list[asyncio.Task]:
+        requests = [self.__prepare_request(request) for request in requests]
+        limited = (
+            {
+                index
+                for index, request in enumerate(requests)
+                if self.send_scheduler.is_limited(request)
+            }
+            if self.send_scheduler is not None
+            else ()
+        )
+
+        batch = [
+            request for index, request in enumerate(requests) if index not in limited
+        ]
+        futures = iter([self._create_request_future(request) for request in batch])
+        if batch:
+            await self.__send_many(batch)
+
+        return [
+            asyncio.ensure_future(
+                self.__send_limited(request)
+                if index in limited
+                else self.__get_result(request, next(futures))
+            )
+            for index, request in enumerate(requests)
+        ]
+
+    async def __get_result(
+        self, request: dict, future: asyncio.Future | None
+    ) -> types.TlObject:
+        request_method = request["@type"].lower()
         is_chat_attempted_load = request_method == "getchat"
         is_message_attempted_load = request_method in self.get_message_methods
 
         while True:
-            future = self._create_request_future(request)
-            await self.__send(request)
-            result = await future
+            if future is None:  # retry
+                future = self._create_request_future(request)
+                await self.__send(request)
+
+            if self.__track_requests:
+                result = await self.__await_tracked_result(request, future)
+            else:
+                result = await future
+            future = None
 
             if not isinstance(result, types.Error):
                 break
@@ -542,47 +1074,122 @@ class Client(Decorators, Methods):
             ):
                 is_message_attempted_load = True
 
-                self.logger.debug(f"Attempt to load message {message_id} in {chat_id}")
-
-                message = await self.getMessage(chat_id=chat_id, message_id=message_id)
-                if message:
-                    self.logger.debug(f"Message {message_id} in {chat_id} is loaded")
+                if await self._load_message(chat_id, message_id):
                     continue
-                else:
-                    self.logger.debug(
-                        f"Failed to load message {message_id} in {chat_id}"
-                    )
 
             if not is_chat_attempted_load and (
                 error_message == "Chat not found" and chat_id
             ):
                 is_chat_attempted_load = True
 
-                self.logger.debug(f"Attempt to load chat {chat_id}")
-
-                chat = await self.getChat(chat_id=chat_id)
-                if not isinstance(chat, types.Error):
-                    self.logger.debug(f"Chat {chat_id} is loaded")
+                reply_to = request.get("reply_to") or {}
+                reply_to_message_id = (
+                    reply_to.get("message_id", 0)
+                    if isinstance(reply_to, dict)
+                    else getattr(reply_to, "message_id", 0)
+                )
 
-                    reply_to_message_id = (request.get("reply_to") or {}).get(
-                        "message_id", 0
+                # if the request is a reply to another message
+                # load the replied message too, to avoid "Message not found"
+                if reply_to_message_id > 0:
+                    is_chat_loaded, is_message_loaded = await asyncio.gather(
+                        self._load_chat(chat_id),
+                        self._load_message(chat_id, reply_to_message_id),
                     )
 
-                    # if the request is a reply to another message
-                    # load the replied message to avoid "Message not found"
-                    if reply_to_message_id > 0:
-                        await self.getMessage(
-                            chat_id=chat_id, message_id=reply_to_message_id
-                        )
+                    # the message may be requested before the chat is loaded
+                    if is_chat_loaded and not is_message_loaded:
+                        await self._load_message(chat_id, reply_to_message_id)
+                else:
+                    is_chat_loaded = await self._load_chat(chat_id)
 
+                if is_chat_loaded:
                     continue
-                else:
-                    self.logger.error(f"Couldn't load chat {chat_id}")
 
             break
 
         return result
 
+    async def __await_tracked_result(
+        self, request: dict, future: asyncio.Future
+    ) -> types.TlObject:
+        method = request["@type"]
+        request_metrics = (
+            self._metrics.get_request(method) if self._metrics is not None else None
+        )
+
+        if request_metrics is not None:
+            request_metrics.in_flight += 1
+            try:
+                result = await future
+            finally:
+                request_metrics.in_flight -= 1
+        else:
+            result = await future
+
+        elapsed = perf_counter() - future.sent_at
+
+        threshold = self.slow_request_threshold
+        if isinstance(threshold, dict):
+            threshold = threshold.get(method)
+        is_slow = threshold is not None and elapsed > threshold
+
+        if is_slow:
+            self.logger.warning(
+                f"Request {method} took {elapsed:.3f}s (threshold {threshold}s)"
+            )
+
+        if request_metrics is not None:
+            request_metrics.latency.observe(elapsed)
+            if isinstance(result, types.Error):
+                request_metrics.observe_error(result.code)
+            if is_slow:
+                request_metrics.slow += 1
+
+        return result
+
+    async def _load_chat(self, chat_id: int) -> bool:
+        r"""Load a chat into TDLib. Chats that were not found are not retried for :attr:`NOT_FOUND_TTL` seconds"""
+
+        key = ("chat", chat_id)
+        if key in self.__not_found:
+            return False
+
+        self.logger.debug(f"Attempt to load chat {chat_id}")
+
+        chat = await self.getChat(chat_id=chat_id)
+        if isinstance(chat, types.Error):
+            self.logger.error(f"Couldn't load chat {chat_id}")
+            if chat.message == "Chat not found":  # not transient errors, e.g. 429
+                self.__not_found.set(key, True)
+            return False
+
+        self.logger.debug(f"Chat {chat_id} is loaded")
+        return True
+
+    async def _load_message(self, chat_id: int, message_id: int) -> bool:
+        r"""Load a message into TDLib, unless it's already known to be loaded.
+        Messages that were not found are not retried for :attr:`NOT_FOUND_TTL` seconds"""
+
+        key = ("message", chat_id, message_id)
+        if key in self.__loaded_messages:
+            return True
+        elif key in self.__not_found:
+            return False
+
+        self.logger.debug(f"Attempt to load message {message_id} in {chat_id}")
+
+        message = await self.getMessage(chat_id=chat_id, message_id=message_id)
+        if not message:
+            self.logger.debug(f"Failed to load message {message_id} in {chat_id}")
+            if message.message == "Message not found":
+                self.__not_found.set(key, True)
+            return False
+
+        self.logger.debug(f"Message {message_id} in {chat_id} is loaded")
+        self.__loaded_messages.set(key, True)
+        return True
+
     async def call_method(self, method: str, **kwargs) -> types.TlObject:
         r"""Call a method. with keyword arguments (``kwargs``) support
 
@@ -691,6 +1298,10 @@ class Client(Decorators, Methods):
 
         self.__stop_client()
 
+        if self.__metrics_server is not None:
+            self.__metrics_server.close()
+            self.__metrics_server = None
+
         if self.client_manager and not self.client_manager.start_clients_on_add:
             await self.client_manager.close()
 
@@ -699,12 +1310,29 @@ class Client(Decorators, Methods):
 
         return True
 
+    def _new_request_id(self) -> int | str:
+        r"""Allocate a new ``@extra`` ID for a request
+
+        Results are routed by ``@client_id`` first, so a per-client counter is enough.
+        With NATS, many instances share the same TDLib client and the ID is prefixed by the instance ID
+        """
+
+        request_id = next(self.__request_ids)
+        return (
+            request_id if not self.is_nats else f"{self._nats_instance_id}/{request_id}"
+        )
+
     def _create_request_future(
-        self, request: dict, result_id: str | None = None, handle_result: bool = True
+        self,
+        request: dict,
+        result_id: int | str | None = None,
+        handle_result: bool = True,
     ) -> asyncio.Future:
         result = asyncio.Future()
 
         result.request = request
+        if self.__track_requests:
+            result.sent_at = perf_counter()
 
         if handle_result:
             self._results[
@@ -724,10 +1352,19 @@ class Client(Decorators, Methods):
         else:
             self.client_manager.send(self.client_id, request)
 
+    async def __send_many(self, requests: list[dict]) -> None:
+        if self.is_nats:
+            await asyncio.gather(*(self.__send(request) for request in requests))
+        else:
+            self.client_manager.send_many(self.client_id, requests)
+
     def _check_nats(self):
         assert self.is_nats, "This method is only available for TDLib Server"
 
     def _check_init_args(self):
+        if self.dispatch_mode not in {"shared", "per_chat"}:
+            raise ValueError("dispatch_mode must be shared or per_chat")
+
         if self.user_bot:
             return
 
@@ -754,6 +1391,7 @@ class Client(Decorators, Methods):
             k: tuple(sorted(v, key=lambda x: (x.position is None, x.position)))
             for k, v in self._handlers.items()
         }
+        self._routers = get_routers(self._current_handlers)
 
     def _load_plugins(self, reload_plugins: bool = False):
         count = 0
@@ -804,6 +1442,7 @@ class Client(Decorators, Methods):
                         inner_object=handler.inner_object,
                         timeout=handler.timeout,
                         is_from_plugin=True,
+                        concurrent=handler.concurrent,
                     )
                     handlers += 1
                     plugin_handlers_count += 1
@@ -846,8 +1485,12 @@ class Client(Decorators, Methods):
                     f"Received result for {result_id}: {obj_to_json(update, indent=4)}"
                 )
 
-            if result_id and (result := self._results.pop(result_id, None)):
-                result.set_result(dict_to_obj(update, self))
+            if (
+                result_id
+                and (result := self._results.pop(result_id, None))
+                and not result.done()
+            ):
+                result.set_result(self._to_obj(update))
 
             elif update["@type"] == "error" and "option" in extra:
                 self.logger.error(f"{extra['option']}: {update['message']}")
@@ -857,124 +1500,333 @@ class Client(Decorators, Methods):
         if is_debug:
             self.logger.debug(f"Received: {obj_to_json(update, indent=4)}")
 
-        update_obj = dict_to_obj(update, self)
+        update_type = update.get("@type")
+        local_handler = self.__local_handlers.get(update_type)
+        has_handlers = bool(self._current_handlers.get(update_type))
+
+        if update_type == "updateNewMessage":
+            message = update["message"]
+            self.__loaded_messages.set(
+                ("message", message["chat_id"], message["id"]), True
+            )
+
+        update_obj = (
+            self.__update_object_cache(update_type, update)
+            if self.object_cache is not None
+            else None
+        )
+
+        # initializers and finalizers only run for update types with handlers,
+        # so anything else can be dropped before building its objects
+        if not local_handler and not has_handlers:
+            return
+
+        if update_obj is None:
+            update_obj = self._to_obj(update)
+
+        if local_handler:
+            self.loop.create_task(local_handler(update_obj))
 
-        if handler := self.__local_handlers.get(update.get("@type")):
-            self.loop.create_task(handler(update_obj))
+        if not has_handlers:
+            return
 
         if not self.is_nats and self.__is_queue_worker:
-            self.queue.put_nowait(update_obj)
+            self.__enqueue_update(update_obj)
         else:
             await self._handle_update(update_obj)
 
+    def __update_object_cache(
+        self, update_type: str, update: dict
+    ) -> types.TlObject | None:
+        r"""Keep :attr:`object_cache` coherent. Returns the update object if it was built"""
+
+        if field := OBJECT_CACHE_UPDATES.get(update_type):
+            update_obj = self._to_obj(update)
+            obj = getattr(update_obj, field)
+            self.object_cache.set((obj.getType(), obj.id), obj)
+
+            return update_obj
+        elif update_type in CHAT_INVALIDATING_UPDATES:
+            self.object_cache.pop(("chat", update.get("chat_id")))
+            return None
+        elif update_type == "updateUserStatus":
+            key = ("user", update.get("user_id"))
+        elif (
+            update_type.startswith("updateChat")
+            and update_type not in CHAT_IGNORED_UPDATES
+        ):
+            key = ("chat", update.get("chat_id"))
+        else:
+            return None
+
+        if (obj := self.object_cache.peek(key)) is None:
+            return None
+
+        fields = self.__get_patch_fields(update_type, obj)
+        if not fields:
+            # a partial patch would leave the object stale, load it again on next use
+            self.object_cache.pop(key)
+            return None
+
+        update_obj = self._to_obj(update)
+        for field in fields:
+            setattr(obj, field, getattr(update_obj, field))
+
+        return update_obj
+
+    def __get_patch_fields(
+        self, update_type: str, obj: types.TlObject
+    ) -> tuple[str, ...]:
+        r"""Get the fields of an update that can be set on the cached object as is, empty if some can't"""
+
+        fields = self.__patch_fields.get(update_type)
+        if fields is None:
+            update_fields = [
+                field
+                for field in getattr(types.TL_TYPES.get(update_type), "__slots__", ())
+                if field not in {"chat_id", "user_id", "_client", "_lazy_fields"}
+            ]
+            obj_fields = set(type(obj).__slots__)
+            fields = self.__patch_fields[update_type] = (
+                tuple(update_fields)
+                if all(field in obj_fields for field in update_fields)
+                else ()
+            )
+
+        return fields
+
+    def _to_obj(self, update: dict) -> types.TlObject:
+        if "@objects" in update:  # Already decoded by ObjDecoder
+            return ObjDecoder.to_obj(update, self)
+
+        return dict_to_obj(update, self, self.lazy_decoding)
+
+    def _is_update_consumed(self, update_type: str) -> bool:
+        return update_type in self.__local_handlers or bool(
+            self._current_handlers.get(update_type)
+        )
+
+    def _is_waiting_for_updates(self) -> bool:
+        # request results, and messages being sent that are only confirmed by updates
+        return bool(self._results or self._send_batches)
+
     def get_inner_object(self, update: types.TlObject):
         if isinstance(update, types.UpdateNewMessage):
             return update.message
         return update
 
-    async def __run_initializers(self, update):
+    def get_update_key(self, update: types.TlObject) -> int | None:
+        r"""Get the key used to order updates when ``dispatch_mode`` is ``per_chat``
+
+        Returns:
+            :py:class:`int`: Chat ID, sender user ID or query ID of the update. ``None`` if the update isn't ordered
+        """
+
+        if isinstance(update, types.UpdateNewMessage):
+            return update.message.chat_id
+
+        if chat_id := getattr(update, "chat_id", None):
+            return chat_id
+        elif isinstance(message := getattr(update, "message", None), types.Message):
+            return message.chat_id
+        elif user_id := getattr(update, "sender_user_id", None):
+            return user_id
+
+        return None
+
+    async def __run_initializers(self, update, deadline: float | None = None):
         inner_object = self.get_inner_object(update)
+        metrics = self._metrics
 
         for initializer in self._current_handlers["initializer"]:
+            if deadline is not None and self.loop.time() >= deadline:
+                break
+
             try:
                 handler_value = inner_object if initializer.inner_object else update
 
-                if initializer.filter is not None:
-                    filter_function = initializer.filter.func
-
-                    if self.is_coro_filter(filter_function):
-                        if not await filter_function(self, handler_value):
+                if (filter := initializer.filter) is not None:
+                    if metrics is not None:
+                        if not await self.__run_timed_filter(
+                            initializer, handler_value
+                        ):
                             continue
-                    elif not filter_function(self, handler_value):
+                    elif filter.is_async:
+                        if not await filter.func(self, handler_value):
+                            continue
+                    elif not filter.func(self, handler_value):
                         continue
 
-                if (
-                    self.default_handlers_timeout is None
-                    and initializer.timeout is None
-                ):
-                    await initializer(self, handler_value)
-                else:
-                    timeout = initializer.timeout or self.default_handlers_timeout
-                    try:
-                        await asyncio.wait_for(
-                            initializer(self, handler_value),
-                            timeout=timeout,
-                        )
-                    except asyncio.TimeoutError:
-                        self.logger.warning(
-                            f"Initializer {initializer} timed out after {timeout} seconds"
-                        )
+                await self.__call_handler(
+                    initializer, handler_value, deadline, "Initializer"
+                )
             except StopHandlers as e:
                 raise e
             except Exception:
                 self.logger.exception(f"Initializer {initializer} failed")
 
-    async def __run_handlers(self, update):
+    async def __run_handlers(self, update, deadline: float | None = None):
         inner_object = self.get_inner_object(update)
+        metrics = self._metrics
 
-        for handler in self._current_handlers[update.getType()]:
-            try:
-                handler_value = inner_object if handler.inner_object else update
+        update_type = update.getType()
+        handlers = self._current_handlers[update_type]
+        if (router := self._routers.get(update_type)) is not None:
+            handlers = router.get_handlers(self, update)
 
-                if handler.filter is not None:
-                    filter_function = handler.filter.func
-                    if self.is_coro_filter(filter_function):
-                        if not await filter_function(self, handler_value):
+        concurrent_tasks = None
+        try:
+            for handler in handlers:
+                if deadline is not None and self.loop.time() >= deadline:
+                    break
+
+                try:
+                    handler_value = inner_object if handler.inner_object else update
+
+                    if (filter := handler.filter) is not None:
+                        if metrics is not None:
+                            if not await self.__run_timed_filter(
+                                handler, handler_value
+                            ):
+                                continue
+                        elif filter.is_async:
+                            if not await filter.func(self, handler_value):
+                                continue
+                        elif not filter.func(self, handler_value):
                             continue
-                    elif not filter_function(self, handler_value):
-                        continue
 
-                if self.default_handlers_timeout is None and handler.timeout is None:
-                    await handler(self, handler_value)
-                else:
-                    timeout = handler.timeout or self.default_handlers_timeout
-                    try:
-                        await asyncio.wait_for(
-                            handler(self, handler_value), timeout=timeout
+                    if handler.concurrent:
+                        if concurrent_tasks is None:
+                            concurrent_tasks = []
+
+                        concurrent_tasks.append(
+                            self.loop.create_task(
+                                self.__run_concurrent_handler(
+                                    handler, handler_value, deadline
+                                )
+                            )
                         )
-                    except asyncio.TimeoutError:
-                        self.logger.warning(
-                            f"Handler {handler} timed out after {timeout} seconds"
+                    else:
+                        await self.__call_handler(
+                            handler, handler_value, deadline, "Handler"
                         )
-            except StopHandlers as e:
-                raise e
-            except Exception:
-                self.logger.exception(f"Exception in {handler}")
+                except StopHandlers as e:
+                    raise e
+                except Exception:
+                    self.logger.exception(f"Exception in {handler}")
+        finally:
+            if concurrent_tasks:
+                await asyncio.gather(*concurrent_tasks)
+
+    async def __run_concurrent_handler(
+        self, handler: Handler, handler_value: types.TlObject, deadline: float | None
+    ):
+        try:
+            await self.__call_handler(handler, handler_value, deadline, "Handler")
+        except StopHandlers:
+            self.logger.debug(f"StopHandlers raised by concurrent {handler} ignored")
+        except Exception:
+            self.logger.exception(f"Exception in {handler}")
 
     async def __run_finalizers(self, update):
         inner_object = self.get_inner_object(update)
+        metrics = self._metrics
 
         for finalizer in self._current_handlers["finalizer"]:
             try:
                 handler_value = inner_object if finalizer.inner_object else update
 
-                if finalizer.filter is not None:
-                    filter_function = finalizer.filter.func
-
-                    if self.is_coro_filter(filter_function):
-                        if not await filter_function(self, handler_value):
+                if (filter := finalizer.filter) is not None:
+                    if metrics is not None:
+                        if not await self.__run_timed_filter(finalizer, handler_value):
                             continue
-                    elif not filter_function(self, handler_value):
+                    elif filter.is_async:
+                        if not await filter.func(self, handler_value):
+                            continue
+                    elif not filter.func(self, handler_value):
                         continue
 
-                if self.default_handlers_timeout is None and finalizer.timeout is None:
-                    await finalizer(self, handler_value)
-                else:
-                    try:
-                        timeout = finalizer.timeout or self.default_handlers_timeout
-                        await asyncio.wait_for(
-                            finalizer(self, handler_value),
-                            timeout=timeout,
-                        )
-                    except asyncio.TimeoutError:
-                        self.logger.warning(
-                            f"Finalizer {finalizer} timed out after {timeout} seconds"
-                        )
+                await self.__call_handler(finalizer, handler_value, None, "Finalizer")
             except StopHandlers as e:
                 raise e
             except Exception:
                 self.logger.exception(f"Finalizer {finalizer} failed")
 
+    async def __run_timed_filter(
+        self, handler: Handler, handler_value: types.TlObject
+    ) -> bool:
+        filter = handler.filter
+        started = perf_counter()
+
+        passed = (
+            await filter.func(self, handler_value)
+            if filter.is_async
+            else filter.func(self, handler_value)
+        )
+
+        handler_metrics = self._metrics.get_handler(handler)
+        handler_metrics.filter_time.observe(perf_counter() - started)
+        if not passed:
+            handler_metrics.filtered_out += 1
+
+        return passed
+
+    async def __call_handler(
+        self,
+        handler: Handler,
+        handler_value: types.TlObject,
+        deadline: float | None,
+        kind: str,
+    ) -> None:
+        if self._metrics is None:
+            return await self.__await_handler(handler, handler_value, deadline, kind)
+
+        handler_metrics = self._metrics.get_handler(handler)
+        started = perf_counter()
+        try:
+            await self.__await_handler(handler, handler_value, deadline, kind)
+        except StopHandlers:
+            handler_metrics.stop_handlers += 1
+            raise
+        except Exception:
+            handler_metrics.exceptions += 1
+            raise
+        finally:
+            handler_metrics.handler_time.observe(perf_counter() - started)
+
+    async def __await_handler(
+        self,
+        handler: Handler,
+        handler_value: types.TlObject,
+        deadline: float | None,
+        kind: str,
+    ) -> None:
+        r"""Await ``handler`` until its own timeout or ``deadline`` (loop time), whichever comes first.
+        Uses a timer on the current task instead of a new task per call"""
+
+        timeout = handler.timeout or self.default_handlers_timeout
+        if timeout is not None:
+            handler_deadline = self.loop.time() + timeout
+            if deadline is None or handler_deadline < deadline:
+                deadline = handler_deadline
+
+        if deadline is None:
+            await handler(self, handler_value)
+            return
+
+        try:
+            async with timeout_at(deadline):
+                await handler(self, handler_value)
+        except asyncio.TimeoutError:
+            handler.timeout_count += 1
+            if self._metrics is not None:
+                self._metrics.get_handler(handler).timeouts += 1
+            self.logger.warning(
+                f"{kind} {handler} timed out after {timeout} seconds"
+                if timeout is not None and deadline == handler_deadline
+                else f"{kind} {handler} timed out, update_timeout of {self.update_timeout} seconds exceeded"
+            )
+
     async def _handle_update(self, update):
         if update.getType() in self._current_handlers:
             if (
@@ -987,19 +1839,68 @@ class Client(Decorators, Methods):
             ):
                 return
 
+            deadline = (
+                self.loop.time() + self.update_timeout
+                if self.update_timeout is not None
+                else None
+            )
+
             try:
-                await self.__run_initializers(update)
-                await self.__run_handlers(update)
+                await self.__run_initializers(update, deadline)
+                await self.__run_handlers(update, deadline)
             except StopHandlers:
                 pass
             finally:
                 await self.__run_finalizers(update)
 
+    def __enqueue_update(self, update: types.TlObject) -> None:
+        # updates waiting for a free slot are kept in order in the intake,
+        # and later ones don't skip ahead of them
+        put_time = perf_counter() if self.queue.track_wait_time else None
+        if not self.__intake:
+            try:
+                self.queue.put_nowait(update, put_time)
+                return
+            except asyncio.QueueFull:
+                pass
+
+        self.__intake.append((put_time, update))
+        self.__intake_event.set()
+
+        if len(self.__intake) >= self.queue.maxsize:
+            self.client_manager.pause_receiving(self.client_id)
+
+    async def __queue_intake_worker(self):
+        intake = self.__intake
+        while self.is_running:
+            if not intake:
+                self.client_manager.resume_receiving(self.client_id)
+                self.__intake_event.clear()
+                await self.__intake_event.wait()
+                continue
+
+            try:
+                await self.queue.put(intake[0][1], intake[0][0])
+            except Exception:
+                self.logger.exception("Got intake worker exception")
+
+            intake.popleft()  # only now, so new updates can't take the free slot first
+
     async def _queue_update_worker(self):
         self.is_running = True
         while self.is_running:
             try:
-                await self._handle_update(await self.queue.get())
+                put_time, update = await self.queue.get()
+
+                if put_time is not None and self._metrics is not None:
+                    self._metrics.observe_queue_wait(
+                        update.getType(), perf_counter() - put_time
+                    )
+
+                try:
+                    await self._handle_update(update)
+                finally:
+                    self.queue.release(update)
             except Exception:
                 self.logger.exception("Got worker exception")
 
@@ -1114,8 +2015,20 @@ class Client(Decorators, Methods):
         self, update: types.UpdateMessageSendSucceeded
     ):
         m_id = f"{update.message.chat_id}:{update.old_message_id}"
+        self.__loaded_messages.set(
+            ("message", update.message.chat_id, update.message.id), True
+        )
 
-        if result := self._results.pop(m_id, None):
+        if self.__resolve_send_batch(
+            update.message.chat_id, update.old_message_id, update.message, True
+        ):
+            return
+
+        if (result := self._results.pop(m_id, None)) is None:
+            self.__sent_messages.set(
+                (update.message.chat_id, update.old_message_id), (update.message, True)
+            )
+        elif not result.done():
             result.set_result(update.message)
 
     async def __handle_update_message_failed(
@@ -1123,10 +2036,82 @@ class Client(Decorators, Methods):
     ):
         m_id = f"{update.message.chat_id}:{update.old_message_id}"
 
-        if result := self._results.pop(m_id, None):
-            result.set_result(
-                update.error if not update.message.media_album_id else update.message
+        if retry_after := update.error.limited_seconds:
+            if self.send_scheduler is not None:
+                self.send_scheduler.on_flood_wait(update.message.chat_id, retry_after)
+
+            for scheduler in self._broadcast_schedulers:
+                scheduler.on_flood_wait(update.message.chat_id, retry_after)
+
+        if self.__resolve_send_batch(
+            update.message.chat_id, update.old_message_id, update.message, False
+        ):
+            return
+
+        if self.send_scheduler is not None and update.error.limited_seconds:
+            if (
+                (result := self._results.get(m_id)) is not None
+                and isinstance(
+                    update.message.sending_state, types.MessageSendingStateFailed
+                )
+                and update.message.sending_state.can_retry
+                and self.send_scheduler.get_retry_after(
+                    update.error, self.__flood_retries.get(result, 0)
+                )
+                is not None
+            ):
+                del self._results[m_id]
+                self.__flood_retries[result] = self.__flood_retries.get(result, 0) + 1
+                self.send_scheduler.retries += 1
+
+                await self.__resend_message(update.message, update.error, result)
+                return
+
+        if (result := self._results.pop(m_id, None)) is None:
+            self.__sent_messages.set(
+                (update.message.chat_id, update.old_message_id), (update.message, False)
             )
+        elif not result.done():
+            result.set_result(update.error)
+
+    async def __handle_update_delete_messages(self, update: types.UpdateDeleteMessages):
+        # messages deleted while being sent get no send succeeded or failed update
+        if update.chat_id in self._send_batches:
+            for message_id in update.message_ids:
+                self.__resolve_send_batch(update.chat_id, message_id, None, False)
+
+    def __resolve_send_batch(
+        self,
+        chat_id: int,
+        message_id: int,
+        message: types.Message | None,
+        is_sent: bool,
+    ) -> bool:
+        for batch in self._send_batches.get(chat_id, ()):
+            if batch.resolve(chat_id, message_id, message, is_sent):
+                return True
+
+        return False
+
+    def __remove_send_batch(self, batch: SendBatch) -> None:
+        for chat_id in batch.chat_ids:
+            if batches := self._send_batches.get(chat_id):
+                batches.remove(batch)
+                if not batches:
+                    del self._send_batches[chat_id]
+
+    async def __resend_message(
+        self, message: types.Message, error: types.Error, result: asyncio.Future
+    ) -> None:
+        # paced by the send scheduler, which waits for the flood wait of the chat
+        res = await self.resendMessages(
+            chat_id=message.chat_id, message_ids=[message.id]
+        )
+
+        if isinstance(res, types.Messages) and res.messages and res.messages[0]:
+            self._results[f"{message.chat_id}:{res.messages[0].id}"] = result
+        elif not result.done():
+            result.set_result(res if isinstance(res, types.Error) else error)
 
     async def __handle_update_option(self, update: types.UpdateOption):
         if isinstance(update.value, types.OptionValueBoolean):
@@ -1236,6 +2221,9 @@ class Client(Decorators, Methods):
             for worker_task in self._workers_tasks:
                 worker_task.cancel()
 
+            self.__intake.clear()
+            self.client_manager.resume_receiving(self.client_id)
+
     def _register_signal_handlers(self):
         def _handle_signal():
             self.loop.create_task(self.stop())
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Event, Thread
+from time import monotonic
 
 import pytdbot
 
 from .tdjson import TdJson
+from .utils import ObjDecoder
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +23,9 @@ class ClientManager:
         lib_path: str | None = None,
         verbosity: int = 2,
         loop: asyncio.AbstractEventLoop | None = None,
+        max_batch_size: int = 1000,
+        max_batch_latency: float = 0.01,
+        fast_decoding: bool = False,
     ) -> None:
         """Manage multiple Pytdbot clients
 
@@ -43,10 +49,23 @@ class ClientManager:
 
             loop (``asyncio.AbstractEventLoop``, *optional*):
                 Event loop to use
+
+            max_batch_size (``int``, *optional*):
+                Max number of updates received from TDLib before they are handed to the event loop at once. Default is ``1000``
+
+            max_batch_latency (``float``, *optional*):
+                Max seconds spent collecting a batch of updates after the first one is received. Default is ``0.01``
+
+            fast_decoding (``bool``, *optional*):
+                Whether to decode received JSON straight into objects in a single pass on the receiver thread (see :class:`~pytdbot.utils.ObjDecoder`). Updates that no client handles are still decoded as ``dict`` only. Default is ``False``
         """
 
         if clients and not isinstance(clients, (list, pytdbot.Client)):
             raise TypeError("clients must be a list of pytdbot.Client")
+        if not isinstance(max_batch_size, int) or max_batch_size < 1:
+            raise ValueError("max_batch_size must be an int greater than 0")
+        if not isinstance(max_batch_latency, (int, float)) or max_batch_latency < 0:
+            raise ValueError("max_batch_latency must be a non-negative number")
 
         self.loop = loop or pytdbot.utils.get_running_loop()
         self.__tdjson = TdJson(lib_path, verbosity)
@@ -64,7 +83,15 @@ class ClientManager:
             self.__pending_clients = None
             self.start_clients_on_add = False
 
-        self.__receiver_task = None
+        self.max_batch_size = max_batch_size
+        self.max_batch_latency = max_batch_latency
+        self.fast_decoding = fast_decoding
+
+        self.__receiver_thread: Thread = None
+        self.__receiver_stopped: asyncio.Event = None
+        self.__receiving = Event()
+        self.__receiving.set()
+        self.__paused_by: set[int] = set()
         self.__should_exit = False
         self.is_running = False
 
@@ -74,7 +101,12 @@ class ClientManager:
         if self.is_running:
             return
 
-        self.__receiver_task = self.loop.create_task(self.__td_receiver_loop())
+        self.is_running = True
+        self.__receiver_stopped = asyncio.Event()
+        self.__receiver_thread = Thread(
+            target=self.__td_receiver_loop, name="ClientManager", daemon=True
+        )
+        self.__receiver_thread.start()
 
         for client in self.__pending_clients:
             await self.add_client(client, start_client=self.start_clients_on_add)
@@ -140,6 +172,43 @@ class ClientManager:
 
         self.__tdjson.send(client_id, request)
 
+    def send_many(self, client_id: int, requests: list[dict]) -> None:
+        """Send many requests to TDlib back-to-back
+
+        Parameters:
+            client_id (``int``):
+                ID of client to send requests from
+
+            requests (``list[dict]``):
+                Requests to send
+        """
+
+        self.__tdjson.send_many(client_id, requests)
+
+    def pause_receiving(self, client_id: int) -> None:
+        """Stop receiving from TDLib while a client can't take more updates.
+        Receiving continues while any client waits for request results
+
+        Parameters:
+            client_id (``int``):
+                ID of the client
+        """
+
+        self.__paused_by.add(client_id)
+        self.__receiving.clear()
+
+    def resume_receiving(self, client_id: int) -> None:
+        """Undo :meth:`pause_receiving` for a client
+
+        Parameters:
+            client_id (``int``):
+                ID of the client
+        """
+
+        self.__paused_by.discard(client_id)
+        if not self.__paused_by:
+            self.__receiving.set()
+
     def check_tdlib_version(self):
         if self.__tdjson.version != pytdbot.types.TDLIB_VERSION:
             logger.warning(
@@ -148,37 +217,80 @@ class ClientManager:
                 "This may cause unexpected behavior or errors"
             )
 
-    async def __td_receiver_loop(self) -> None:
-        with ThreadPoolExecutor(
-            max_workers=1, thread_name_prefix="ClientManager"
-        ) as executor:
+    def __td_receiver_loop(self) -> None:
+        decoder = (
+            ObjDecoder(self.__is_update_wanted).decode if self.fast_decoding else None
+        )
+        receive = partial(self.__tdjson.receive, decoder=decoder)
+        max_batch_size = self.max_batch_size
+        max_batch_latency = self.max_batch_latency
+
+        try:
+            logger.info("ClientManager started")
+
+            while not self.__should_exit:
+                # Backpressure: TDLib keeps the updates while clients are full,
+                # but results of pending requests must still arrive
+                while (
+                    not self.__receiving.is_set()
+                    and not self.__should_exit
+                    and not self.__has_pending_requests()
+                ):
+                    self.__receiving.wait(0.1)
+
+                update = receive(100000.0)  # Seconds
+
+                if not update or self.__should_exit:
+                    continue
+
+                # Drain whatever TDLib already has queued without blocking,
+                # so the whole burst costs a single event loop wakeup
+                updates = [update]
+                deadline = monotonic() + max_batch_latency
+                while len(updates) < max_batch_size and monotonic() < deadline:
+                    update = receive(0.0)
+                    if not update:
+                        break
+
+                    updates.append(update)
+
+                if self.__should_exit:
+                    break
+
+                self.loop.call_soon_threadsafe(self.__dispatch_updates, updates)
+
+        except Exception:
+            logger.exception("Error in td_receiver")
+        finally:
+            self.is_running = False
+            logger.debug("ClientManager stopped")
+
             try:
-                self.is_running = True
-                logger.info("ClientManager started")
-
-                while not self.__should_exit:
-                    update = await self.loop.run_in_executor(
-                        executor,
-                        self.__tdjson.receive,
-                        100000.0,  # Seconds
-                    )
-
-                    if not update or self.__should_exit:
-                        continue
-
-                    client = self.__clients.get(update["@client_id"])
-                    if client:
-                        self.loop.create_task(client.process_update(update))
-                    else:
-                        logger.warning(
-                            f"Unknown client ID in update: {update['@client_id']}"
-                        )
-
-            except Exception:
-                logger.exception("Error in td_receiver")
-            finally:
-                self.is_running = False
-                logger.debug("ClientManager stopped")
+                self.loop.call_soon_threadsafe(self.__receiver_stopped.set)
+            except RuntimeError:  # Event loop is closed
+                pass
+
+    def __has_pending_requests(self) -> bool:
+        return any(
+            client._is_waiting_for_updates() for client in list(self.__clients.values())
+        )
+
+    def __is_update_wanted(self, update_type: str) -> bool:
+        if not update_type.startswith("update"):  # Results are always needed
+            return True
+
+        return any(
+            client._is_update_consumed(update_type)
+            for client in list(self.__clients.values())
+        )
+
+    def __dispatch_updates(self, updates: list[dict]) -> None:
+        for update in updates:
+            client = self.__clients.get(update["@client_id"])
+            if client:
+                self.loop.create_task(client.process_update(update))
+            else:
+                logger.warning(f"Unknown client ID in update: {update['@client_id']}")
 
     async def close(self, close_all_clients: bool = False) -> bool:
         """Close the Client Manager
@@ -194,6 +306,7 @@ class ClientManager:
             return True
 
         self.__should_exit = True
+        self.__receiving.set()
 
         if close_all_clients:
             for client_id in list(self.__clients.keys()):
@@ -202,7 +315,7 @@ class ClientManager:
         # Send dummy request to wake up receiver
         self.send(0, {"@type": "getOption", "name": "version"})
 
-        await self.__receiver_task
+        await self.__receiver_stopped.wait()
 
         logger.info("ClientManager closed")
         return True
@@ -1,4 +1,8 @@
-from collections.abc import Callable
+import re
+from collections.abc import Callable, Iterable
+from inspect import iscoroutinefunction
+
+from . import types
 
 
 class Filter:
@@ -6,6 +10,9 @@ class Filter:
 
     A filter is a function that takes a request and returns a boolean. If the returned value is ``True`` then the handler will be called.
     See :func:`~pytdbot.filters.create` for more information
+
+    Filters can be combined with ``&`` (and), ``|`` (or) and ``~`` (not). Combined filters are compiled into a single function:
+    if all the filters are sync the result is sync, otherwise async filters are only awaited when they are reached
     """
 
     def __init__(self, func: Callable):
@@ -13,6 +20,26 @@ class Filter:
         if not callable(func):
             raise TypeError("func must be callable")
 
+        self.is_async = iscoroutinefunction(func)
+
+    def __call__(self, client, update):
+        return self.func(client, update)
+
+    def __and__(self, other: "Filter") -> "Filter":
+        if not isinstance(other, Filter):
+            return NotImplemented
+
+        return AndFilter(self, other)
+
+    def __or__(self, other: "Filter") -> "Filter":
+        if not isinstance(other, Filter):
+            return NotImplemented
+
+        return OrFilter(self, other)
+
+    def __invert__(self) -> "Filter":
+        return InvertFilter(self)
+
     def __str__(self) -> str:
         return f"Filter(func={self.func})"
 
@@ -20,6 +47,94 @@ class Filter:
         return str(self)
 
 
+class AndFilter(Filter):
+    r"""A filter that passes if all of its filters pass, evaluated left to right until one fails"""
+
+    def __init__(self, *filters: Filter):
+        self.filters = _flatten(AndFilter, filters)
+        super().__init__(_compile(self.filters, stop_on=False))
+
+    def __str__(self) -> str:
+        return f"({' & '.join(map(str, self.filters))})"
+
+
+class OrFilter(Filter):
+    r"""A filter that passes if any of its filters passes, evaluated left to right until one passes"""
+
+    def __init__(self, *filters: Filter):
+        self.filters = _flatten(OrFilter, filters)
+        super().__init__(_compile(self.filters, stop_on=True))
+
+    def __str__(self) -> str:
+        return f"({' | '.join(map(str, self.filters))})"
+
+
+class InvertFilter(Filter):
+    r"""A filter that passes if its filter doesn't pass"""
+
+    def __init__(self, filter: Filter):
+        self.filter = filter
+        func = filter.func
+
+        if filter.is_async:
+
+            async def inverted(client, update) -> bool:
+                return not await func(client, update)
+
+        else:
+
+            def inverted(client, update) -> bool:
+                return not func(client, update)
+
+        super().__init__(inverted)
+
+    def __invert__(self) -> Filter:
+        return self.filter
+
+    def __str__(self) -> str:
+        return f"~{self.filter}"
+
+
+def _flatten(filter_type: type, filters: Iterable[Filter]) -> tuple[Filter, ...]:
+    flat = []
+    for filter in filters:
+        if type(filter) is filter_type:
+            flat.extend(filter.filters)
+        else:
+            flat.append(filter)
+
+    return tuple(flat)
+
+
+def _compile(filters: tuple[Filter, ...], stop_on: bool) -> Callable:
+    r"""Compile ``filters`` into one function that returns ``stop_on`` as soon as a filter returns it"""
+
+    if not any(filter.is_async for filter in filters):
+        funcs = tuple(filter.func for filter in filters)
+
+        def compiled(client, update) -> bool:
+            for func in funcs:
+                if bool(func(client, update)) is stop_on:
+                    return stop_on
+            return not stop_on
+
+        return compiled
+
+    parts = tuple((filter.func, filter.is_async) for filter in filters)
+
+    async def compiled_async(client, update) -> bool:
+        for func, is_async in parts:
+            result = func(client, update)
+            if is_async:
+                result = await result
+
+            if bool(result) is stop_on:
+                return stop_on
+        return not stop_on
+
+    return compiled_async
+
+
 def create(func: Callable) -> Filter:
     r"""A factory to create a filter
 
@@ -59,3 +174,217 @@ def create(func: Callable) -> Filter:
     """
 
     return Filter(func)
+
+
+def get_chat_id(update) -> int | None:
+    r"""Get the chat ID of an update or message, ``None`` if it has no chat"""
+
+    if isinstance(update, types.UpdateNewMessage):
+        return update.message.chat_id
+    elif (chat_id := getattr(update, "chat_id", None)) is not None:
+        return chat_id
+    elif isinstance(message := getattr(update, "message", None), types.Message):
+        return message.chat_id
+
+
+def get_text(update) -> str:
+    r"""Get the text of an update or message: message text or caption, or inline query. Empty string if there is no text"""
+
+    if isinstance(update, types.UpdateNewMessage):
+        update = update.message
+
+    if isinstance(update, types.Message):
+        return update.text or update.caption or ""
+    elif isinstance(update, types.UpdateNewInlineQuery):
+        return update.query
+
+    return ""
+
+
+class UpdateTypeFilter(Filter):
+    r"""A filter that passes updates of the given types. See :func:`~pytdbot.filters.update_type`"""
+
+    def __init__(self, update_types: Iterable[str]):
+        self.update_types = frozenset(update_types)
+        update_types = self.update_types
+
+        super().__init__(lambda _, update: update.getType() in update_types)
+
+    def __str__(self) -> str:
+        return f"UpdateTypeFilter(update_types={set(self.update_types)})"
+
+
+class ChatFilter(Filter):
+    r"""A filter that passes updates of the given chats. See :func:`~pytdbot.filters.chat`"""
+
+    def __init__(self, chat_ids: Iterable[int]):
+        self.chat_ids = frozenset(chat_ids)
+        chat_ids = self.chat_ids
+
+        super().__init__(lambda _, update: get_chat_id(update) in chat_ids)
+
+    def __str__(self) -> str:
+        return f"ChatFilter(chat_ids={set(self.chat_ids)})"
+
+
+class TextFilter(Filter):
+    r"""A filter that passes updates whose text is exactly one of the given texts. See :func:`~pytdbot.filters.text`"""
+
+    def __init__(self, texts: Iterable[str]):
+        self.texts = frozenset(texts)
+        texts = self.texts
+
+        super().__init__(lambda _, update: get_text(update) in texts)
+
+    def __str__(self) -> str:
+        return f"TextFilter(texts={set(self.texts)})"
+
+
+class CommandFilter(Filter):
+    r"""A filter that passes messages starting with one of the given commands. See :func:`~pytdbot.filters.command`"""
+
+    def __init__(
+        self,
+        commands: Iterable[str],
+        prefixes: str | Iterable[str] = "/",
+        case_sensitive: bool = False,
+    ):
+        self.prefixes = (prefixes,) if isinstance(prefixes, str) else tuple(prefixes)
+        self.case_sensitive = case_sensitive
+        self.commands = frozenset(
+            command if case_sensitive else command.lower() for command in commands
+        )
+
+        super().__init__(self.__check)
+
+    def get_command(self, client, update) -> str | None:
+        r"""Get the command name of an update if it's addressed to this bot, without prefix and bot username"""
+
+        text = get_text(update)
+        if not text or not text.startswith(self.prefixes):
+            return None
+
+        for prefix in self.prefixes:
+            if text.startswith(prefix):
+                break
+
+        text = text[len(prefix) :]
+        if not text or text[0].isspace():  # a bare prefix or "/ foo"
+            return None
+
+        command, _, username = text.split(maxsplit=1)[0].partition("@")
+        if username and not _is_my_username(client, username):
+            return None
+
+        return command if self.case_sensitive else command.lower()
+
+    def __check(self, client, update) -> bool:
+        return self.get_command(client, update) in self.commands
+
+    def __str__(self) -> str:
+        return f"CommandFilter(commands={set(self.commands)}, prefixes={self.prefixes})"
+
+
+class RegexFilter(Filter):
+    r"""A filter that passes updates whose text matches a pattern. See :func:`~pytdbot.filters.regex`"""
+
+    def __init__(self, pattern: str | re.Pattern, flags: int = 0):
+        self.pattern = re.compile(pattern, flags)
+        search = self.pattern.search
+
+        super().__init__(lambda _, update: search(get_text(update)) is not None)
+
+    def __str__(self) -> str:
+        return f"RegexFilter(pattern={self.pattern.pattern!r})"
+
+
+def _is_my_username(client, username: str) -> bool:
+    me = getattr(client, "me", None)
+    if me is None or not isinstance(me.usernames, types.Usernames):
+        return True  # can't tell, don't drop the command
+
+    username = username.lower()
+    return any(
+        active_username.lower() == username
+        for active_username in me.usernames.active_usernames
+    )
+
+
+def update_type(*update_types: str) -> UpdateTypeFilter:
+    r"""Pass updates of the given types; useful with initializers and finalizers
+
+    Example:
+        .. code-block:: python
+
+            @client.initializer(filters=filters.update_type("updateNewMessage", "updateNewCallbackQuery"))
+            async def log_update(c, update):
+                ...
+
+    Parameters:
+        update_types (``str``):
+            TDLib update types, e.g. ``updateNewMessage``
+    """
+
+    return UpdateTypeFilter(update_types)
+
+
+def chat(*chat_ids: int) -> ChatFilter:
+    r"""Pass updates of the given chats
+
+    Parameters:
+        chat_ids (``int``):
+            Chat IDs
+    """
+
+    return ChatFilter(chat_ids)
+
+
+def text(*texts: str) -> TextFilter:
+    r"""Pass updates whose text (message text or caption, or inline query) is exactly one of ``texts``
+
+    Parameters:
+        texts (``str``):
+            Texts to match
+    """
+
+    return TextFilter(texts)
+
+
+def command(
+    *commands: str, prefixes: str | Iterable[str] = "/", case_sensitive: bool = False
+) -> CommandFilter:
+    r"""Pass messages that start with one of the given commands, e.g. ``/start`` or ``/start@MyBot``
+
+    Example:
+        .. code-block:: python
+
+            @client.on_updateNewMessage(filters=filters.command("start", "help") & ~filters.chat(-100123))
+            async def start(c, message):
+                await message.reply_text("Hi!")
+
+    Parameters:
+        commands (``str``):
+            Command names without prefix
+
+        prefixes (``str`` | ``list[str]``, *optional*):
+            Command prefixes. Default is ``/``
+
+        case_sensitive (``bool``, *optional*):
+            Whether commands are case sensitive. Default is ``False``
+    """
+
+    return CommandFilter(commands, prefixes, case_sensitive)
+
+
+def regex(pattern: str | re.Pattern, flags: int = 0) -> RegexFilter:
+    r"""Pass updates whose text (message text or caption, or inline query) matches ``pattern``
+
+    Parameters:
+        pattern (``str`` | :py:class:`re.Pattern`):
+            Regular expression, searched anywhere in the text
+
+        flags (``int``, *optional*):
+            Regular expression flags. Default is ``0``
+    """
+
+    return RegexFilter(pattern, flags)
@@ -149,6 +149,7 @@ class Decorators(Updates):
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> HandlerDecorator:
         r"""A decorator to handle ``updateNewMessage`` but with ``Message`` object.
 
@@ -162,6 +163,9 @@ class Decorators(Updates):
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -178,6 +182,7 @@ class Decorators(Updates):
                         position=position,
                         inner_object=True,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -189,6 +194,7 @@ class Decorators(Updates):
                     position=position,
                     inner_object=True,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -198,6 +204,7 @@ class Decorators(Updates):
                     position=position,
                     inner_object=True,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
 
             return func
@@ -18,6 +18,8 @@ class Handler:
         "inner_object",
         "timeout",
         "is_from_plugin",
+        "concurrent",
+        "timeout_count",
     )
 
     def __init__(
@@ -29,6 +31,7 @@ class Handler:
         inner_object: bool = False,
         timeout: float | None = None,
         is_from_plugin: bool = False,
+        concurrent: bool = False,
     ) -> None:
         self.func = func
         self.update_type = update_type
@@ -37,12 +40,14 @@ class Handler:
         self.inner_object = inner_object
         self.timeout = timeout
         self.is_from_plugin = is_from_plugin
+        self.concurrent = concurrent
+        self.timeout_count = 0
 
     def __call__(self, client: "pytdbot.Client", update: "pytdbot.types.Update"):
         return self.func(client, update)
 
     def __str__(self) -> str:
-        return f"Handler(func={self.func}, update_type={self.update_type}, filter={self.filter}, position={self.position}, inner_object={self.inner_object}, timeout={self.timeout}, is_from_plugin={self.is_from_plugin})"
+        return f"Handler(func={self.func}, update_type={self.update_type}, filter={self.filter}, position={self.position}, inner_object={self.inner_object}, timeout={self.timeout}, is_from_plugin={self.is_from_plugin}, concurrent={self.concurrent})"
 
     def __repr__(self) -> str:
         return str(self)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+
+import pytdbot
+
+from ..filters import (
+    AndFilter,
+    ChatFilter,
+    CommandFilter,
+    Filter,
+    RegexFilter,
+    TextFilter,
+    get_chat_id,
+    get_text,
+)
+from .handler import Handler
+
+# backreferences and conditional groups, which change meaning when groups are renumbered
+GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+SCOPED_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s", re.VERBOSE: "x"}
+
+
+class HandlersRouter:
+    r"""Find the handlers that may match an update without evaluating every filter
+
+    Handlers whose filter is (or is an ``&`` combination containing) a :func:`~pytdbot.filters.command`,
+    :func:`~pytdbot.filters.text`, :func:`~pytdbot.filters.chat` or :func:`~pytdbot.filters.regex` filter are indexed by it.
+    All the regex filters are joined into one pattern, so texts that match none of them are rejected in a single search.
+    Other handlers are always candidates. Candidates are returned in the original order and their filters still have to be run
+
+    Parameters:
+        handlers (``Sequence[Handler]``):
+            Ordered handlers of an update type
+    """
+
+    def __init__(self, handlers: Sequence[Handler]) -> None:
+        self.handlers = tuple(handlers)
+
+        self.unindexed: list[int] = []
+        self.texts: dict[str, list[int]] = {}
+        self.chats: dict[int, list[int]] = {}
+        self.commands: dict[tuple, tuple[CommandFilter, dict[str, list[int]]]] = {}
+        self.regexes: list[int] = []
+        self.regex: re.Pattern | None = None
+
+        patterns = []
+        for index, handler in enumerate(self.handlers):
+            index_filter = get_index_filter(handler.filter)
+
+            if isinstance(index_filter, TextFilter):
+                for text in index_filter.texts:
+                    self.texts.setdefault(text, []).append(index)
+            elif isinstance(index_filter, CommandFilter):
+                group_key = (index_filter.prefixes, index_filter.case_sensitive)
+                if group_key not in self.commands:
+                    self.commands[group_key] = (
+                        CommandFilter((), *group_key),
+                        {},
+                    )
+
+                commands = self.commands[group_key][1]
+                for command in index_filter.commands:
+                    commands.setdefault(command, []).append(index)
+            elif isinstance(index_filter, ChatFilter):
+                for chat_id in index_filter.chat_ids:
+                    self.chats.setdefault(chat_id, []).append(index)
+            elif isinstance(index_filter, RegexFilter) and (
+                pattern := to_scoped_pattern(index_filter.pattern)
+            ):
+                self.regexes.append(index)
+                patterns.append(pattern)
+            else:
+                self.unindexed.append(index)
+
+        if patterns:
+            try:
+                self.regex = re.compile("|".join(patterns))
+            except re.error:  # e.g. same group name in many patterns
+                self.unindexed.extend(self.regexes)
+                self.unindexed.sort()
+                self.regexes = []
+
+        self.is_indexed = len(self.unindexed) != len(self.handlers)
+
+    def get_handlers(
+        self, client: pytdbot.Client, update: pytdbot.types.Update
+    ) -> Sequence[Handler]:
+        r"""Get the candidate handlers of an update, in order"""
+
+        if not self.is_indexed:
+            return self.handlers
+
+        found = set(self.unindexed)
+        text = get_text(update)
+
+        if self.texts and (indexes := self.texts.get(text)):
+            found.update(indexes)
+
+        if text:
+            try:
+                for command_filter, commands in self.commands.values():
+                    command = command_filter.get_command(client, update)
+                    if command is not None and (indexes := commands.get(command)):
+                        found.update(indexes)
+            except Exception:
+                # let every handler run its own filter, so the error is handled per handler
+                return self.handlers
+
+        if self.regexes and self.regex.search(text) is not None:
+            found.update(self.regexes)
+
+        if self.chats and (indexes := self.chats.get(get_chat_id(update))):
+            found.update(indexes)
+
+        handlers = self.handlers
+        return [handlers[index] for index in sorted(found)]
+
+
+def get_index_filter(filter: Filter | None) -> Filter | None:
+    r"""Get the filter a handler can be indexed by, the most selective one of an ``&`` combination"""
+
+    if isinstance(filter, AndFilter):
+        leaves = [get_index_filter(leaf) for leaf in filter.filters]
+        for filter_type in (TextFilter, CommandFilter, ChatFilter, RegexFilter):
+            for leaf in leaves:
+                if isinstance(leaf, filter_type):
+                    return leaf
+
+        return None
+    elif isinstance(filter, (TextFilter, CommandFilter, ChatFilter, RegexFilter)):
+        return filter
+
+    return None
+
+
+def to_scoped_pattern(pattern: re.Pattern) -> str | None:
+    r"""Get ``pattern`` as a group with its own flags, to be joined with other patterns.
+    ``None`` if it can't be joined"""
+
+    if isinstance(pattern.pattern, bytes) or GROUP_REFERENCE.search(pattern.pattern):
+        return None
+
+    flags = ""
+    other_flags = pattern.flags & ~re.UNICODE
+    for flag, flag_char in SCOPED_FLAGS.items():
+        if other_flags & flag:
+            flags += flag_char
+            other_flags &= ~flag
+
+    if other_flags:
+        return None
+
+    end = "\n" if "x" in flags else ""  # ends a trailing comment of a verbose pattern
+    scoped = f"(?{flags}:{pattern.pattern}{end})"
+    try:
+        re.compile(scoped)
+    except re.error:  # e.g. global inline flags
+        return None
+
+    return scoped
+
+
+def get_routers(handlers: dict[str, Iterable[Handler]]) -> dict[str, HandlersRouter]:
+    r"""Build routers for ``updateNewMessage`` handlers, if worth it"""
+
+    routers = {}
+    if len(message_handlers := tuple(handlers.get("updateNewMessage", ()))) > 1:
+        router = HandlersRouter(message_handlers)
+        if router.is_indexed:
+            routers["updateNewMessage"] = router
+
+    return routers
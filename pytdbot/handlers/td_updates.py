@@ -19,6 +19,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The user authorization state has changed
 
@@ -32,6 +33,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -48,6 +52,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -59,6 +64,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -68,6 +74,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -78,6 +85,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new message was received; can also be an outgoing message
 
@@ -91,6 +99,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -107,6 +118,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -118,6 +130,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -127,6 +140,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -137,6 +151,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A request to send a message has reached the Telegram server\. This doesn't mean that the message will be sent successfully\. This update is sent only if the option \"use\_quick\_ack\" is set to true\. This update may be sent multiple times for the same message
 
@@ -150,6 +165,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -166,6 +184,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -177,6 +196,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -186,6 +206,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -196,6 +217,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A message has been successfully sent
 
@@ -209,6 +231,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -225,6 +250,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -236,6 +262,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -245,6 +272,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -255,6 +283,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A message failed to send\. Be aware that some messages being sent can be irrecoverably deleted, in which case updateDeleteMessages will be received instead of this update
 
@@ -268,6 +297,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -284,6 +316,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -295,6 +328,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -304,6 +338,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -314,6 +349,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The message content has changed
 
@@ -327,6 +363,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -343,6 +382,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -354,6 +394,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -363,6 +404,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -373,6 +415,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A message was edited\. Changes in the message content will come in a separate updateMessageContent
 
@@ -386,6 +429,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -402,6 +448,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -413,6 +460,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -422,6 +470,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -432,6 +481,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The message pinned state was changed
 
@@ -445,6 +495,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -461,6 +514,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -472,6 +526,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -481,6 +536,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -491,6 +547,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The information about interactions with a message has changed
 
@@ -504,6 +561,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -520,6 +580,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -531,6 +592,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -540,6 +602,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -550,6 +613,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The message content was opened\. Updates voice note messages to \"listened\", video note messages to \"viewed\" and starts the self\-destruct timer
 
@@ -563,6 +627,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -579,6 +646,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -590,6 +658,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -599,6 +668,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -609,6 +679,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A message with an unread mention was read
 
@@ -622,6 +693,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -638,6 +712,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -649,6 +724,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -658,6 +734,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -668,6 +745,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of unread reactions added to a message was changed
 
@@ -681,6 +759,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -697,6 +778,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -708,6 +790,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -717,6 +800,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -727,6 +811,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Unread votes were added or removed from a poll message
 
@@ -740,6 +825,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -756,6 +844,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -767,6 +856,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -776,6 +866,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -786,6 +877,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A fact\-check added to a message was changed
 
@@ -799,6 +891,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -815,6 +910,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -826,6 +922,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -835,6 +932,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -845,6 +943,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Information about suggested post of a message was changed
 
@@ -858,6 +957,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -874,6 +976,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -885,6 +988,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -894,6 +998,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -904,6 +1009,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A message with a live location was viewed\. When the update is received, the application is expected to update the live location
 
@@ -917,6 +1023,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -933,6 +1042,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -944,6 +1054,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -953,6 +1064,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -963,6 +1075,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""An automatically scheduled message with video has been successfully sent after conversion
 
@@ -976,6 +1089,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -992,6 +1108,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1003,6 +1120,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1012,6 +1130,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1022,6 +1141,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new chat has been loaded/created\. This update is guaranteed to come before the chat identifier is returned to the application\. The chat field changes will be reported through separate updates
 
@@ -1035,6 +1155,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1051,6 +1174,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1062,6 +1186,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1071,6 +1196,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1081,6 +1207,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The title of a chat was changed
 
@@ -1094,6 +1221,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1110,6 +1240,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1121,6 +1252,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1130,6 +1262,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1140,6 +1273,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat photo was changed
 
@@ -1153,6 +1287,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1169,6 +1306,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1180,6 +1318,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1189,6 +1328,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1199,6 +1339,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Chat accent colors have changed
 
@@ -1212,6 +1353,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1228,6 +1372,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1239,6 +1384,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1248,6 +1394,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1258,6 +1405,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Chat permissions were changed
 
@@ -1271,6 +1419,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1287,6 +1438,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1298,6 +1450,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1307,6 +1460,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1317,6 +1471,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The last message of a chat was changed
 
@@ -1330,6 +1485,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1346,6 +1504,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1357,6 +1516,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1366,6 +1526,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1376,6 +1537,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The position of a chat in a chat list has changed\. An updateChatLastMessage or updateChatDraftMessage update might be sent instead of the update
 
@@ -1389,6 +1551,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1405,6 +1570,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1416,6 +1582,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1425,6 +1592,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1435,6 +1603,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat was added to a chat list
 
@@ -1448,6 +1617,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1464,6 +1636,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1475,6 +1648,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1484,6 +1658,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1494,6 +1669,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat was removed from a chat list
 
@@ -1507,6 +1683,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1523,6 +1702,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1534,6 +1714,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1543,6 +1724,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1553,6 +1735,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Incoming messages were read or the number of unread messages has been changed
 
@@ -1566,6 +1749,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1582,6 +1768,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1593,6 +1780,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1602,6 +1790,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1612,6 +1801,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Outgoing messages were read
 
@@ -1625,6 +1815,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1641,6 +1834,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1652,6 +1846,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1661,6 +1856,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1671,6 +1867,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat action bar was changed
 
@@ -1684,6 +1881,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1700,6 +1900,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1711,6 +1912,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1720,6 +1922,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1730,6 +1933,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The bar for managing business bot was changed in a chat
 
@@ -1743,6 +1947,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1759,6 +1966,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1770,6 +1978,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1779,6 +1988,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1789,6 +1999,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat available reactions were changed
 
@@ -1802,6 +2013,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1818,6 +2032,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1829,6 +2044,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1838,6 +2054,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1848,6 +2065,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat draft has changed\. Be aware that the update may come in the currently opened chat but with old content of the draft\. If the user has changed the content of the draft, this update mustn't be applied
 
@@ -1861,6 +2079,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1877,6 +2098,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1888,6 +2110,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1897,6 +2120,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1907,6 +2131,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Chat emoji status has changed
 
@@ -1920,6 +2145,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1936,6 +2164,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -1947,6 +2176,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -1956,6 +2186,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1966,6 +2197,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The message sender that is selected to send messages in a chat has changed
 
@@ -1979,6 +2211,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -1995,6 +2230,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2006,6 +2242,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2015,6 +2252,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2025,6 +2263,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The message auto\-delete or self\-destruct timer setting for a chat was changed
 
@@ -2038,6 +2277,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2054,6 +2296,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2065,6 +2308,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2074,6 +2318,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2084,6 +2329,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Notification settings for a chat were changed
 
@@ -2097,6 +2343,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2113,6 +2362,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2124,6 +2374,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2133,6 +2384,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2143,6 +2395,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat pending join requests were changed
 
@@ -2156,6 +2409,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2172,6 +2428,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2183,6 +2440,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2192,6 +2450,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2202,6 +2461,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat reply markup was changed
 
@@ -2215,6 +2475,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2231,6 +2494,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2242,6 +2506,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2251,6 +2516,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2261,6 +2527,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat background was changed
 
@@ -2274,6 +2541,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2290,6 +2560,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2301,6 +2572,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2310,6 +2582,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2320,6 +2593,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat theme was changed
 
@@ -2333,6 +2607,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2349,6 +2626,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2360,6 +2638,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2369,6 +2648,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2379,6 +2659,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat unread\_mention\_count has changed
 
@@ -2392,6 +2673,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2408,6 +2692,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2419,6 +2704,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2428,6 +2714,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2438,6 +2725,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat unread\_reaction\_count has changed
 
@@ -2451,6 +2739,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2467,6 +2758,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2478,6 +2770,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2487,6 +2780,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2497,6 +2791,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The chat unread\_poll\_vote\_count has changed
 
@@ -2510,6 +2805,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2526,6 +2824,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2537,6 +2836,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2546,6 +2846,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2556,6 +2857,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat video chat state has changed
 
@@ -2569,6 +2871,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2585,6 +2890,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2596,6 +2902,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2605,6 +2912,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2615,6 +2923,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The value of the default disable\_notification parameter, used when a message is sent to the chat, was changed
 
@@ -2628,6 +2937,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2644,6 +2956,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2655,6 +2968,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2664,6 +2978,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2674,6 +2989,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat content was allowed or restricted for saving
 
@@ -2687,6 +3003,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2703,6 +3022,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2714,6 +3034,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2723,6 +3044,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2733,6 +3055,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Translation of chat messages was enabled or disabled
 
@@ -2746,6 +3069,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2762,6 +3088,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2773,6 +3100,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2782,6 +3110,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2792,6 +3121,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat was marked as unread or was read
 
@@ -2805,6 +3135,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2821,6 +3154,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2832,6 +3166,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2841,6 +3176,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2851,6 +3187,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat default appearance has changed
 
@@ -2864,6 +3201,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2880,6 +3220,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2891,6 +3232,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2900,6 +3242,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2910,6 +3253,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat was blocked or unblocked
 
@@ -2923,6 +3267,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2939,6 +3286,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -2950,6 +3298,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -2959,6 +3308,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -2969,6 +3319,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat's has\_scheduled\_messages field has changed
 
@@ -2982,6 +3333,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -2998,6 +3352,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3009,6 +3364,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3018,6 +3374,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3028,6 +3385,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of chat folders or a chat folder has changed
 
@@ -3041,6 +3399,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3057,6 +3418,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3068,6 +3430,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3077,6 +3440,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3087,6 +3451,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The number of online group members has changed\. This update with non\-zero number of online group members is sent only for currently opened chats\. There is no guarantee that it is sent just after the number of online users has changed
 
@@ -3100,6 +3465,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3116,6 +3484,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3127,6 +3496,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3136,6 +3506,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3146,6 +3517,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Basic information about a Saved Messages topic has changed\. This update is guaranteed to come before the topic identifier is returned to the application
 
@@ -3159,6 +3531,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3175,6 +3550,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3186,6 +3562,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3195,6 +3572,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3205,6 +3583,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Number of Saved Messages topics has changed
 
@@ -3218,6 +3597,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3234,6 +3616,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3245,6 +3628,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3254,6 +3638,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3264,6 +3649,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Basic information about a topic in a channel direct messages chat administered by the current user has changed\. This update is guaranteed to come before the topic identifier is returned to the application
 
@@ -3277,6 +3663,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3293,6 +3682,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3304,6 +3694,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3313,6 +3704,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3323,6 +3715,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Number of messages in a topic has changed; for Saved Messages and channel direct messages chat topics only
 
@@ -3336,6 +3729,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3352,6 +3748,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3363,6 +3760,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3372,6 +3770,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3382,6 +3781,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Basic information about a quick reply shortcut has changed\. This update is guaranteed to come before the quick shortcut name is returned to the application
 
@@ -3395,6 +3795,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3411,6 +3814,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3422,6 +3826,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3431,6 +3836,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3441,6 +3847,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A quick reply shortcut and all its messages were deleted
 
@@ -3454,6 +3861,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3470,6 +3880,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3481,6 +3892,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3490,6 +3902,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3500,6 +3913,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of quick reply shortcuts has changed
 
@@ -3513,6 +3927,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3529,6 +3946,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3540,6 +3958,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3549,6 +3968,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3559,6 +3979,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of quick reply shortcut messages has changed
 
@@ -3572,6 +3993,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3588,6 +4012,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3599,6 +4024,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3608,6 +4034,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3618,6 +4045,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Basic information about a topic in a forum chat was changed
 
@@ -3631,6 +4059,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3647,6 +4078,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3658,6 +4090,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3667,6 +4100,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3677,6 +4111,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Information about a topic in a forum chat was changed
 
@@ -3690,6 +4125,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3706,6 +4144,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3717,6 +4156,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3726,6 +4166,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3736,6 +4177,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Notification settings for some type of chats were updated
 
@@ -3749,6 +4191,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3765,6 +4210,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3776,6 +4222,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3785,6 +4232,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3795,6 +4243,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Notification settings for reactions were updated
 
@@ -3808,6 +4257,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3824,6 +4276,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3835,6 +4288,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3844,6 +4298,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3854,6 +4309,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A notification was changed
 
@@ -3867,6 +4323,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3883,6 +4342,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3894,6 +4354,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3903,6 +4364,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3913,6 +4375,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A list of active notifications in a notification group has changed
 
@@ -3926,6 +4389,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -3942,6 +4408,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -3953,6 +4420,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -3962,6 +4430,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -3972,6 +4441,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Contains active notifications that were shown on previous application launches\. This update is sent only if the message database is used\. In that case it comes once before any updateNotification and updateNotificationGroup update
 
@@ -3985,6 +4455,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4001,6 +4474,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4012,6 +4486,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4021,6 +4496,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4031,6 +4507,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Describes whether there are some pending notification updates\. Can be used to prevent application from killing, while there are some pending notifications
 
@@ -4044,6 +4521,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4060,6 +4540,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4071,6 +4552,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4080,6 +4562,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4090,6 +4573,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some messages were deleted
 
@@ -4103,6 +4587,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4119,6 +4606,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4130,6 +4618,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4139,6 +4628,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4149,6 +4639,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A message sender activity in the chat has changed
 
@@ -4162,6 +4653,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4178,6 +4672,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4189,6 +4684,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4198,6 +4694,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4208,6 +4705,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new pending text or rich message was received in a chat with a bot\. The message must be shown in the chat for at most getOption\(\"pending\_text\_message\_period\"\) seconds, replace any other pending message with the same draft\_id, and be deleted whenever any incoming message from the bot in the message thread is received
 
@@ -4221,6 +4719,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4237,6 +4738,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4248,6 +4750,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4257,6 +4760,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4267,6 +4771,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The user went online or offline
 
@@ -4280,6 +4785,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4296,6 +4804,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4307,6 +4816,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4316,6 +4826,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4326,6 +4837,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some data of a user has changed\. This update is guaranteed to come before the user identifier is returned to the application
 
@@ -4339,6 +4851,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4355,6 +4870,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4366,6 +4882,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4375,6 +4892,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4385,6 +4903,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some data of a basic group has changed\. This update is guaranteed to come before the basic group identifier is returned to the application
 
@@ -4398,6 +4917,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4414,6 +4936,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4425,6 +4948,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4434,6 +4958,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4444,6 +4969,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some data of a supergroup or a channel has changed\. This update is guaranteed to come before the supergroup identifier is returned to the application
 
@@ -4457,6 +4983,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4473,6 +5002,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4484,6 +5014,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4493,6 +5024,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4503,6 +5035,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some data of a secret chat has changed\. This update is guaranteed to come before the secret chat identifier is returned to the application
 
@@ -4516,6 +5049,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4532,6 +5068,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4543,6 +5080,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4552,6 +5090,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4562,6 +5101,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some data in userFullInfo has been changed
 
@@ -4575,6 +5115,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4591,6 +5134,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4602,6 +5146,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4611,6 +5156,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4621,6 +5167,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some data in basicGroupFullInfo has been changed
 
@@ -4634,6 +5181,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4650,6 +5200,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4661,6 +5212,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4670,6 +5222,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4680,6 +5233,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some data in supergroupFullInfo has been changed
 
@@ -4693,6 +5247,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4709,6 +5266,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4720,6 +5278,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4729,6 +5288,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4739,6 +5299,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A service notification from the server was received\. Upon receiving this the application must show a popup with the content of the notification
 
@@ -4752,6 +5313,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4768,6 +5332,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4779,6 +5344,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4788,6 +5354,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4798,6 +5365,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""An OAuth authorization request was received
 
@@ -4811,6 +5379,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4827,6 +5398,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4838,6 +5410,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4847,6 +5420,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4857,6 +5431,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Information about a file was updated
 
@@ -4870,6 +5445,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4886,6 +5464,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4897,6 +5476,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4906,6 +5486,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4916,6 +5497,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The file generation process needs to be started by the application\. Use setFileGenerationProgress and finishFileGeneration to generate the file
 
@@ -4929,6 +5511,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -4945,6 +5530,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -4956,6 +5542,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -4965,6 +5552,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -4975,6 +5563,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""File generation is no longer needed
 
@@ -4988,6 +5577,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5004,6 +5596,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5015,6 +5608,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5024,6 +5618,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5034,6 +5629,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The state of the file download list has changed
 
@@ -5047,6 +5643,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5063,6 +5662,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5074,6 +5674,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5083,6 +5684,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5093,6 +5695,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A file was added to the file download list\. This update is sent only after file download list is loaded for the first time
 
@@ -5106,6 +5709,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5122,6 +5728,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5133,6 +5740,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5142,6 +5750,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5152,6 +5761,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A file download was changed\. This update is sent only after file download list is loaded for the first time
 
@@ -5165,6 +5775,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5181,6 +5794,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5192,6 +5806,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5201,6 +5816,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5211,6 +5827,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A file was removed from the file download list\. This update is sent only after file download list is loaded for the first time
 
@@ -5224,6 +5841,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5240,6 +5860,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5251,6 +5872,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5260,6 +5882,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5270,6 +5893,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A request can't be completed unless application verification is performed; for official mobile applications only\. The method setApplicationVerificationToken must be called once the verification is completed or failed
 
@@ -5283,6 +5907,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5299,6 +5926,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5310,6 +5938,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5319,6 +5948,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5329,6 +5959,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A request can't be completed unless reCAPTCHA verification is performed; for official mobile applications only\. The method setApplicationVerificationToken must be called once the verification is completed or failed
 
@@ -5342,6 +5973,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5358,6 +5992,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5369,6 +6004,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5378,6 +6014,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5388,6 +6025,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""New call was created or information about a call was updated
 
@@ -5401,6 +6039,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5417,6 +6058,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5428,6 +6070,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5437,6 +6080,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5447,6 +6091,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Information about a group call was updated
 
@@ -5460,6 +6105,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5476,6 +6124,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5487,6 +6136,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5496,6 +6146,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5506,6 +6157,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Information about a group call participant was changed\. The updates are sent only after the group call is received through getGroupCall and only if the call is joined or being joined
 
@@ -5519,6 +6171,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5535,6 +6190,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5546,6 +6202,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5555,6 +6212,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5565,6 +6223,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of group call participants that can send and receive encrypted call data has changed; for group calls not bound to a chat only
 
@@ -5578,6 +6237,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5594,6 +6256,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5605,6 +6268,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5614,6 +6278,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5624,6 +6289,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The verification state of an encrypted group call has changed; for group calls not bound to a chat only
 
@@ -5637,6 +6303,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5653,6 +6322,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5664,6 +6334,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5673,6 +6344,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5683,6 +6355,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new message was received in a group call
 
@@ -5696,6 +6369,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5712,6 +6388,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5723,6 +6400,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5732,6 +6410,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5742,6 +6421,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new paid reaction was received in a live story group call
 
@@ -5755,6 +6435,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5771,6 +6454,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5782,6 +6466,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5791,6 +6476,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5801,6 +6487,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A group call message failed to send
 
@@ -5814,6 +6501,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5830,6 +6520,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5841,6 +6532,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5850,6 +6542,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5860,6 +6553,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some group call messages were deleted
 
@@ -5873,6 +6567,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5889,6 +6586,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5900,6 +6598,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5909,6 +6608,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5919,6 +6619,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of top donors in live story group call has changed
 
@@ -5932,6 +6633,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -5948,6 +6652,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -5959,6 +6664,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -5968,6 +6674,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -5978,6 +6685,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""New call signaling data arrived
 
@@ -5991,6 +6699,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6007,6 +6718,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6018,6 +6730,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6027,6 +6740,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6037,6 +6751,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""State of a gift auction was updated
 
@@ -6050,6 +6765,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6066,6 +6784,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6077,6 +6796,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6086,6 +6806,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6096,6 +6817,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of auctions in which participate the current user has changed
 
@@ -6109,6 +6831,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6125,6 +6850,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6136,6 +6862,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6145,6 +6872,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6155,6 +6883,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some privacy setting rules have been changed
 
@@ -6168,6 +6897,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6184,6 +6916,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6195,6 +6928,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6204,6 +6938,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6214,6 +6949,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Number of unread messages in a chat list has changed\. This update is sent only if the message database is used
 
@@ -6227,6 +6963,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6243,6 +6982,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6254,6 +6994,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6263,6 +7004,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6273,6 +7015,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Number of unread chats, i\.e\. with unread messages or marked as unread, has changed\. This update is sent only if the message database is used
 
@@ -6286,6 +7029,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6302,6 +7048,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6313,6 +7060,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6322,6 +7070,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6332,6 +7081,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A join request from the user was completed
 
@@ -6345,6 +7095,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6361,6 +7114,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6372,6 +7126,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6381,6 +7136,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6391,6 +7147,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A story was changed
 
@@ -6404,6 +7161,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6420,6 +7180,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6431,6 +7192,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6440,6 +7202,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6450,6 +7213,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A story became inaccessible
 
@@ -6463,6 +7227,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6479,6 +7246,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6490,6 +7258,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6499,6 +7268,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6509,6 +7279,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A story has been successfully posted
 
@@ -6522,6 +7293,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6538,6 +7312,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6549,6 +7324,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6558,6 +7334,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6568,6 +7345,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A story failed to post\. If the story posting is canceled, then updateStoryDeleted will be received instead of this update
 
@@ -6581,6 +7359,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6597,6 +7378,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6608,6 +7390,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6617,6 +7400,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6627,6 +7411,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of active stories posted by a specific chat has changed
 
@@ -6640,6 +7425,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6656,6 +7444,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6667,6 +7456,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6676,6 +7466,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6686,6 +7477,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Number of chats in a story list has changed
 
@@ -6699,6 +7491,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6715,6 +7510,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6726,6 +7522,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6735,6 +7532,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6745,6 +7543,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Story stealth mode settings have changed
 
@@ -6758,6 +7557,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6774,6 +7576,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6785,6 +7588,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6794,6 +7598,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6804,6 +7609,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Lists of bots which Mini Apps must be allowed to read text from clipboard and must be opened without a warning
 
@@ -6817,6 +7623,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6833,6 +7642,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6844,6 +7654,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6853,6 +7664,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6863,6 +7675,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""An option changed its value
 
@@ -6876,6 +7689,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6892,6 +7708,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6903,6 +7720,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6912,6 +7730,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6922,6 +7741,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A sticker set has changed
 
@@ -6935,6 +7755,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -6951,6 +7774,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -6962,6 +7786,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -6971,6 +7796,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -6981,6 +7807,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of installed sticker sets was updated
 
@@ -6994,6 +7821,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7010,6 +7840,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7021,6 +7852,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7030,6 +7862,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7040,6 +7873,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of trending sticker sets was updated or some of them were viewed
 
@@ -7053,6 +7887,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7069,6 +7906,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7080,6 +7918,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7089,6 +7928,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7099,6 +7939,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of recently used stickers was updated
 
@@ -7112,6 +7953,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7128,6 +7972,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7139,6 +7984,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7148,6 +7994,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7158,6 +8005,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of favorite stickers was updated
 
@@ -7171,6 +8019,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7187,6 +8038,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7198,6 +8050,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7207,6 +8060,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7217,6 +8071,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of saved animations was updated
 
@@ -7230,6 +8085,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7246,6 +8104,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7257,6 +8116,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7266,6 +8126,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7276,6 +8137,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of saved notification sounds was updated\. This update may not be sent until information about a notification sound was requested for the first time
 
@@ -7289,6 +8151,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7305,6 +8170,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7316,6 +8182,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7325,6 +8192,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7335,6 +8203,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The default background has changed
 
@@ -7348,6 +8217,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7364,6 +8236,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7375,6 +8248,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7384,6 +8258,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7394,6 +8269,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of available emoji chat themes has changed
 
@@ -7407,6 +8283,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7423,6 +8302,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7434,6 +8314,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7443,6 +8324,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7453,6 +8335,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of supported accent colors has changed
 
@@ -7466,6 +8349,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7482,6 +8368,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7493,6 +8380,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7502,6 +8390,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7512,6 +8401,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of supported accent colors for user profiles has changed
 
@@ -7525,6 +8415,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7541,6 +8434,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7552,6 +8446,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7561,6 +8456,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7571,6 +8467,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Web browser settings have been updated
 
@@ -7584,6 +8481,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7600,6 +8500,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7611,6 +8512,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7620,6 +8522,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7630,6 +8533,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some language pack strings have been updated
 
@@ -7643,6 +8547,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7659,6 +8566,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7670,6 +8578,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7679,6 +8588,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7689,6 +8599,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The connection state has changed\. This update must be used only to show a human\-readable description of the connection state
 
@@ -7702,6 +8613,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7718,6 +8632,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7729,6 +8644,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7738,6 +8654,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7748,6 +8665,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The freeze state of the current user's account has changed
 
@@ -7761,6 +8679,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7777,6 +8698,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7788,6 +8710,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7797,6 +8720,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7807,6 +8731,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The parameters for age verification of the current user's account has changed
 
@@ -7820,6 +8745,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7836,6 +8764,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7847,6 +8776,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7856,6 +8786,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7866,6 +8797,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""New terms of service must be accepted by the user\. If the terms of service are declined, then the deleteAccount method must be called with the reason \"Decline ToS update\"
 
@@ -7879,6 +8811,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7895,6 +8830,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7906,6 +8842,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7915,6 +8852,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7925,6 +8863,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The first unconfirmed session has changed
 
@@ -7938,6 +8877,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -7954,6 +8896,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -7965,6 +8908,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -7974,6 +8918,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -7984,6 +8929,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of bots added to attachment or side menu has changed
 
@@ -7997,6 +8943,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8013,6 +8962,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8024,6 +8974,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8033,6 +8984,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8043,6 +8995,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A message was sent by an opened Web App, so the Web App needs to be closed
 
@@ -8056,6 +9009,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8072,6 +9028,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8083,6 +9040,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8092,6 +9050,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8102,6 +9061,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of active emoji reactions has changed
 
@@ -8115,6 +9075,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8131,6 +9094,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8142,6 +9106,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8151,6 +9116,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8161,6 +9127,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of available message effects has changed
 
@@ -8174,6 +9141,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8190,6 +9160,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8201,6 +9172,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8210,6 +9182,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8220,6 +9193,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The type of default reaction has changed
 
@@ -8233,6 +9207,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8249,6 +9226,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8260,6 +9238,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8269,6 +9248,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8279,6 +9259,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The type of default paid reaction has changed
 
@@ -8292,6 +9273,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8308,6 +9292,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8319,6 +9304,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8328,6 +9314,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8338,6 +9325,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Tags used in Saved Messages or a Saved Messages topic have changed
 
@@ -8351,6 +9339,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8367,6 +9358,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8378,6 +9370,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8387,6 +9380,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8397,6 +9391,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of messages with active live location that need to be updated by the application has changed\. The list is persistent across application restarts only if the message database is used
 
@@ -8410,6 +9405,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8426,6 +9424,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8437,6 +9436,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8446,6 +9446,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8456,6 +9457,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The number of Telegram Stars owned by the current user has changed
 
@@ -8469,6 +9471,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8485,6 +9490,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8496,6 +9502,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8505,6 +9512,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8515,6 +9523,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The number of Toncoins owned by the current user has changed
 
@@ -8528,6 +9537,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8544,6 +9556,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8555,6 +9568,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8564,6 +9578,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8574,6 +9589,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The revenue earned from sponsored messages in a chat has changed\. If chat revenue screen is opened, then getChatRevenueTransactions may be called to fetch new transactions
 
@@ -8587,6 +9603,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8603,6 +9622,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8614,6 +9634,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8623,6 +9644,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8633,6 +9655,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The Telegram Star revenue earned by a user or a chat has changed\. If Telegram Star transaction screen of the chat is opened, then getStarTransactions may be called to fetch new transactions
 
@@ -8646,6 +9669,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8662,6 +9688,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8673,6 +9700,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8682,6 +9710,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8692,6 +9721,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The Toncoin revenue earned by the current user has changed\. If Toncoin transaction screen of the chat is opened, then getTonTransactions may be called to fetch new transactions
 
@@ -8705,6 +9735,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8721,6 +9754,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8732,6 +9766,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8741,6 +9776,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8751,6 +9787,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The parameters of speech recognition without Telegram Premium subscription has changed
 
@@ -8764,6 +9801,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8780,6 +9820,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8791,6 +9832,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8800,6 +9842,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8810,6 +9853,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The levels of live story group call messages have changed
 
@@ -8823,6 +9867,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8839,6 +9886,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8850,6 +9898,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8859,6 +9908,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8869,6 +9919,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of supported dice emojis has changed
 
@@ -8882,6 +9933,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8898,6 +9952,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8909,6 +9964,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8918,6 +9974,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8928,6 +9985,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The stake dice state has changed
 
@@ -8941,6 +9999,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -8957,6 +10018,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -8968,6 +10030,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -8977,6 +10040,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -8987,6 +10051,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Some animated emoji message was clicked and a big animated sticker must be played if the message is visible on the screen\. chatActionWatchingAnimations with the text of the message needs to be sent if the sticker is played
 
@@ -9000,6 +10065,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9016,6 +10084,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9027,6 +10096,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9036,6 +10106,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9046,6 +10117,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The parameters of animation search through getOption\(\"animation\_search\_bot\_username\"\) bot has changed
 
@@ -9059,6 +10131,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9075,6 +10150,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9086,6 +10162,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9095,6 +10172,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9105,6 +10183,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The styles supported for text composition have changed
 
@@ -9118,6 +10197,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9134,6 +10216,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9145,6 +10228,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9154,6 +10238,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9164,6 +10249,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of suggested to the user actions has changed
 
@@ -9177,6 +10263,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9193,6 +10282,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9204,6 +10294,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9213,6 +10304,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9223,6 +10315,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Download or upload file speed for the user was limited, but it can be restored by subscription to Telegram Premium\. The notification can be postponed until a being downloaded or uploaded file is visible to the user\. Use getOption\(\"premium\_download\_speedup\"\) or getOption\(\"premium\_upload\_speedup\"\) to get expected speedup after subscription to Telegram Premium
 
@@ -9236,6 +10329,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9252,6 +10348,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9263,6 +10360,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9272,6 +10370,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9282,6 +10381,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The list of contacts that had birthdays recently or will have birthday soon has changed
 
@@ -9295,6 +10395,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9311,6 +10414,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9322,6 +10426,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9331,6 +10436,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9341,6 +10447,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Autosave settings for some type of chats were updated
 
@@ -9354,6 +10461,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9370,6 +10480,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9381,6 +10492,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9390,6 +10502,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9400,6 +10513,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A business connection has changed; for bots only
 
@@ -9413,6 +10527,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9429,6 +10546,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9440,6 +10558,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9449,6 +10568,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9459,6 +10579,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new message was added to a business account; for bots only
 
@@ -9472,6 +10593,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9488,6 +10612,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9499,6 +10624,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9508,6 +10634,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9518,6 +10645,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A message in a business account was edited; for bots only
 
@@ -9531,6 +10659,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9547,6 +10678,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9558,6 +10690,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9567,6 +10700,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9577,6 +10711,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Messages in a business account were deleted; for bots only
 
@@ -9590,6 +10725,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9606,6 +10744,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9617,6 +10756,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9626,6 +10766,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9636,6 +10777,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming inline query; for bots only
 
@@ -9649,6 +10791,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9665,6 +10810,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9676,6 +10822,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9685,6 +10832,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9695,6 +10843,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""The user has chosen a result of an inline query; for bots only
 
@@ -9708,6 +10857,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9724,6 +10876,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9735,6 +10888,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9744,6 +10898,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9754,6 +10909,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming guest query; for bots only
 
@@ -9767,6 +10923,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9783,6 +10942,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9794,6 +10954,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9803,6 +10964,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9813,6 +10975,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming callback query; for bots only
 
@@ -9826,6 +10989,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9842,6 +11008,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9853,6 +11020,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9862,6 +11030,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9872,6 +11041,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming callback query from a message sent via a bot; for bots only
 
@@ -9885,6 +11055,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9901,6 +11074,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9912,6 +11086,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9921,6 +11096,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9931,6 +11107,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming callback query from a business message; for bots only
 
@@ -9944,6 +11121,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -9960,6 +11140,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -9971,6 +11152,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -9980,6 +11162,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -9990,6 +11173,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming shipping query; for bots only\. Only for invoices with flexible price
 
@@ -10003,6 +11187,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10019,6 +11206,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10030,6 +11218,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10039,6 +11228,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10049,6 +11239,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming pre\-checkout query; for bots only\. Contains full information about a checkout
 
@@ -10062,6 +11253,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10078,6 +11272,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10089,6 +11284,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10098,6 +11294,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10108,6 +11305,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming event; for bots only
 
@@ -10121,6 +11319,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10137,6 +11338,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10148,6 +11350,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10157,6 +11360,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10167,6 +11371,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A new incoming query; for bots only
 
@@ -10180,6 +11385,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10196,6 +11404,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10207,6 +11416,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10216,6 +11426,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10226,6 +11437,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A poll was updated; for bots only
 
@@ -10239,6 +11451,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10255,6 +11470,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10266,6 +11482,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10275,6 +11492,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10285,6 +11503,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A user changed the answer to a poll; for bots only
 
@@ -10298,6 +11517,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10314,6 +11536,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10325,6 +11548,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10334,6 +11558,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10344,6 +11569,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A bot that can be managed by the current bot was created or updated; for bots only
 
@@ -10357,6 +11583,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10373,6 +11602,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10384,6 +11614,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10393,6 +11624,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10403,6 +11635,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""User rights changed in a chat; for bots only
 
@@ -10416,6 +11649,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10432,6 +11668,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10443,6 +11680,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10452,6 +11690,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10462,6 +11701,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A user sent a join request to a chat; for bots only
 
@@ -10475,6 +11715,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10491,6 +11734,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10502,6 +11746,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10511,6 +11756,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10521,6 +11767,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""A chat boost has changed; for bots only
 
@@ -10534,6 +11781,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10550,6 +11800,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10561,6 +11812,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10570,6 +11822,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10580,6 +11833,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""User changed its reactions on a message with public reactions; for bots only
 
@@ -10593,6 +11847,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10609,6 +11866,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10620,6 +11878,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10629,6 +11888,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10639,6 +11899,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Reactions added to a message with anonymous reactions have changed; for bots only
 
@@ -10652,6 +11913,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10668,6 +11932,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10679,6 +11944,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10688,6 +11954,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10698,6 +11965,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Paid media were purchased by a user; for bots only
 
@@ -10711,6 +11979,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10727,6 +11998,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10738,6 +12010,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10747,6 +12020,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -10757,6 +12031,7 @@ class Updates:
         filters: pytdbot.filters.Filter | None = None,
         position: int | None = None,
         timeout: float | None = None,
+        concurrent: bool = False,
     ) -> Callable:
         r"""Contains a list of updates
 
@@ -10770,6 +12045,9 @@ class Updates:
             timeout (``float``, *optional*):
                 Max execution time for the handler before it timeout. Default is ``None``
 
+            concurrent (``bool``, *optional*):
+                Whether the handler is independent of the other handlers and can run concurrently with them. Default is ``False``
+
         Raises:
             :py:class:`TypeError`
         """
@@ -10786,6 +12064,7 @@ class Updates:
                         position=position,
                         inner_object=False,
                         timeout=timeout,
+                        concurrent=concurrent,
                     )
                 else:
                     raise TypeError("Handler must be async")
@@ -10797,6 +12076,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             else:
                 func._handler = Handler(
@@ -10806,6 +12086,7 @@ class Updates:
                     position=position,
                     inner_object=False,
                     timeout=timeout,
+                    concurrent=concurrent,
                 )
             return func
 
@@ -1,3 +1,9 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from functools import partial
+from itertools import islice
+from sys import getsizeof
+
 from ..types import (
     ChatTypeSupergroup,
     Error,
@@ -48,9 +54,25 @@ from ..types import (
     TextParseModeHTML,
     TextParseModeMarkdown,
 )
-from ..utils import MediaAlbumFuture
+from ..utils import (
+    BroadcastResult,
+    SendScheduler,
+    parse_html,
+    parse_markdown_v2,
+)
 from .td_functions import TDLibFunctions
 
+# approximate size of a text entity and its type object
+ENTITY_SIZE = 120
+
+
+def _get_parsed_size(text: str, result: FormattedText) -> int:
+    return (
+        getsizeof(text)
+        + getsizeof(result.text)
+        + ENTITY_SIZE * len(result.entities or ())
+    )
+
 
 class Methods(TDLibFunctions):
     r"""TDLib API functions class"""
@@ -78,6 +100,26 @@ class Methods(TDLibFunctions):
 
         parse_mode = parse_mode.lower()
 
+        if self.parse_cache is not None:
+            key = (text, parse_mode)
+            if (result := self.parse_cache.get(key)) is not None:
+                return result
+
+            result = await self.__parse_text(text, parse_mode)
+            if not isinstance(result, Error):
+                self.parse_cache.set(key, result, _get_parsed_size(text, result))
+
+            return result
+
+        return await self.__parse_text(text, parse_mode)
+
+    async def __parse_text(self, text: str, parse_mode: str) -> Error | FormattedText:
+        if self.local_text_parsing and parse_mode in ("html", "markdownv2"):
+            try:
+                return (parse_html if parse_mode == "html" else parse_markdown_v2)(text)
+            except ValueError:
+                pass  # invalid or unsupported by the local parser, TDLib decides
+
         if parse_mode == "markdown":
             mode = TextParseModeMarkdown(version=1)
         elif parse_mode == "markdownv2":
@@ -132,7 +174,8 @@ class Methods(TDLibFunctions):
         reply_to: InputMessageReplyTo = None,
         reply_to_message_id: int = 0,
     ) -> Error | Messages:
-        r"""Sends 2-10 messages grouped together into an album. Currently, only audio, document, photo and video messages can be grouped into an album. Documents and audio files can be only grouped in an album with messages of the same type. Returns sent messages
+        r"""Sends 2-10 messages grouped together into an album. Currently, only audio, document, photo and video messages can be grouped into an album. Documents and audio files can be only grouped in an album with messages of the same type. Returns sent messages,
+        or the messages still being sent after :attr:`~pytdbot.Client.SEND_BATCH_TIMEOUT` seconds
 
         Parameters:
             chat_id (``int``):
@@ -174,7 +217,7 @@ class Methods(TDLibFunctions):
         if self.load_messages_before_reply and isinstance(
             reply_to, InputMessageReplyToMessage
         ):
-            await self.getMessage(chat_id=chat_id, message_id=reply_to.message_id)
+            await self._load_message(chat_id, reply_to.message_id)
 
         res = await self.sendMessageAlbum(
             chat_id=chat_id,
@@ -191,11 +234,7 @@ class Methods(TDLibFunctions):
         if not res:
             return res
 
-        album_future = MediaAlbumFuture(res)
-        for message in res.messages:
-            self._results[f"{message.chat_id}:{message.id}"] = album_future
-
-        return await album_future
+        return await self.wait_messages_sent(res, self.SEND_BATCH_TIMEOUT)
 
     async def sendTextMessage(
         self,
@@ -1704,7 +1743,7 @@ class Methods(TDLibFunctions):
         if self.load_messages_before_reply and isinstance(
             reply_to, InputMessageReplyToMessage
         ):
-            await self.getMessage(chat_id=chat_id, message_id=reply_to.message_id)
+            await self._load_message(chat_id, reply_to.message_id)
 
         res = await self.sendMessage(
             chat_id=chat_id,
@@ -1725,6 +1764,149 @@ class Methods(TDLibFunctions):
 
         return await self._create_request_future(None, f"{res.chat_id}:{res.id}")
 
+    async def broadcast(
+        self,
+        chat_ids: Iterable[int],
+        content: InputMessageContent,
+        concurrency: int = 20,
+        start_index: int = 0,
+        wait_sent: bool = True,
+        disable_notification: bool = False,
+        protect_content: bool = False,
+        allow_paid_broadcast: bool = False,
+        reply_markup: (
+            ReplyMarkupInlineKeyboard
+            | ReplyMarkupShowKeyboard
+            | ReplyMarkupForceReply
+            | ReplyMarkupRemoveKeyboard
+        ) = None,
+    ) -> AsyncIterator[BroadcastResult]:
+        r"""Send a message to many chats and iterate over the results as soon as they are received
+
+        Sending is paced to Telegram limits and messages failed with ``429 Too Many Requests`` are sent again after the flood wait,
+        by the client :class:`~pytdbot.utils.SendScheduler` if ``rate_limit`` is enabled, otherwise by a scheduler of the broadcast
+
+        Example:
+            .. code-block:: python
+
+                content = types.InputMessageText(text=types.FormattedText(text="Hello!"))
+                async for result in client.broadcast(user_ids, content, start_index=saved_checkpoint):
+                    if not result.ok:
+                        print(result.chat_id, result.result)
+
+                    saved_checkpoint = result.checkpoint
+
+        Parameters:
+            chat_ids (``Iterable[int]``):
+                Target chats
+
+            content (:class:`~pytdbot.types.InputMessageContent`):
+                The content of the message
+
+            concurrency (``int``, *optional*):
+                Max number of messages being sent at once. Default is ``20``
+
+            start_index (``int``, *optional*):
+                Number of chats to skip from the start of ``chat_ids``, e.g. the last :attr:`~pytdbot.utils.BroadcastResult.checkpoint` of an interrupted broadcast. Default is ``0``
+
+            wait_sent (``bool``, *optional*):
+                If ``True``, wait until each message is sent by Telegram (``updateMessageSendSucceeded``), otherwise only until it is accepted by TDLib.
+                Messages that fail to be sent later are not reported in the latter case, but their flood waits still pause their chats. Default is ``True``
+
+            disable_notification (``bool``, *optional*):
+                If True, disable notification for the messages. Default is ``False``
+
+            protect_content (``bool``, *optional*):
+                If True, the content of the messages must be protected from forwarding and saving
+
+            allow_paid_broadcast (``bool``, *optional*):
+                Pass true to allow the messages to ignore regular broadcast limits for a small fee; for bots only. Default is ``False``
+
+            reply_markup (:class:`~pytdbot.types.ReplyMarkupInlineKeyboard` | :class:`~pytdbot.types.ReplyMarkupShowKeyboard` | :class:`~pytdbot.types.ReplyMarkupForceReply` | :class:`~pytdbot.types.ReplyMarkupRemoveKeyboard`, *optional*):
+                The message reply markup
+
+        Returns:
+            :py:class:`~collections.abc.AsyncIterator` of :class:`~pytdbot.utils.BroadcastResult`
+        """
+
+        if not isinstance(concurrency, int) or concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+
+        if not isinstance(reply_markup, ReplyMarkup):
+            reply_markup = None
+
+        if wait_sent:
+            send = partial(
+                self.sendMessageWithContent,
+                content=content,
+                disable_notification=disable_notification,
+                protect_content=protect_content,
+                allow_paid_broadcast=allow_paid_broadcast,
+                reply_markup=reply_markup,
+            )
+        else:
+            send = partial(
+                self.sendMessage,
+                options=MessageSendOptions(
+                    disable_notification=disable_notification,
+                    protect_content=protect_content,
+                    allow_paid_broadcast=allow_paid_broadcast,
+                ),
+                reply_markup=reply_markup,
+                input_message_content=content,
+            )
+
+        # sends are already paced by invoke if the client has a scheduler
+        scheduler = SendScheduler() if self.send_scheduler is None else None
+        if scheduler is not None and not wait_sent:
+            # flood waits of messages failed after being accepted by TDLib,
+            # with wait_sent they are the results of the sends and seen by run
+            self._broadcast_schedulers.append(scheduler)
+        recipients = enumerate(islice(chat_ids, start_index, None), start_index)
+        results = asyncio.Queue()
+
+        async def worker():
+            try:
+                for index, chat_id in recipients:
+                    result = await (
+                        scheduler.run(chat_id, partial(send, chat_id=chat_id))
+                        if scheduler is not None
+                        else send(chat_id=chat_id)
+                    )
+                    results.put_nowait((index, chat_id, result))
+            except Exception as e:
+                results.put_nowait(e)
+            finally:
+                results.put_nowait(None)
+
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        running = len(workers)
+        done = set()
+        checkpoint = start_index
+
+        try:
+            while running:
+                item = await results.get()
+                if item is None:
+                    running -= 1
+                    continue
+                elif isinstance(item, Exception):
+                    raise item
+
+                index, chat_id, result = item
+                done.add(index)
+                while checkpoint in done:
+                    done.remove(checkpoint)
+                    checkpoint += 1
+
+                yield BroadcastResult(index, chat_id, result, checkpoint)
+        finally:
+            for task in workers:
+                task.cancel()
+
+            if scheduler in self._broadcast_schedulers:
+                self._broadcast_schedulers.remove(scheduler)
+
     async def createStarsInvoice(
         self,
         title: str,
@@ -4,8 +4,10 @@ except ImportError:
     tdjson = None
 
 import sys
+from collections.abc import Callable
 from ctypes import CDLL, c_char_p, c_double, c_int
 from logging import getLogger
+from typing import Any
 
 from ..utils import JSON_ENCODER, json_dumps, json_loads
 
@@ -116,13 +118,18 @@ class TdJson:
         """Returns an opaque identifier of a new TDLib instance"""
         return self._td_create_client_id()
 
-    def receive(self, timeout: float = 2.0) -> None | dict:
+    def receive(
+        self, timeout: float = 2.0, decoder: Callable[[bytes | str], Any] | None = None
+    ) -> None | dict:
         """Receives incoming updates and results from TDLib
 
         Parameters:
             timeout (``float``, *optional*):
                 The maximum number of seconds allowed to wait for new data. Default is ``2.0``
 
+            decoder (``Callable``, *optional*):
+                Function used to decode the received JSON, e.g. :meth:`~pytdbot.utils.ObjDecoder.decode`. Default is ``None`` (``json_loads``)
+
         Returns:
             :py:class:``dict``: An incoming update or result to a request. If no data is received, ``None`` is returned
         """
@@ -130,7 +137,7 @@ class TdJson:
         if res := self._td_receive(
             timeout if self.using_binding else c_double(timeout)
         ):
-            return json_loads(res)
+            return (decoder or json_loads)(res)
 
     def send(self, client_id: int, data: dict) -> None:
         """Sends a request to TDLib
@@ -155,6 +162,26 @@ class TdJson:
             ),
         )
 
+    def send_many(self, client_id: int, data: list[dict]) -> None:
+        """Sends many requests to TDLib. All requests are encoded before sending any of them
+
+        Parameters:
+            client_id (``int``):
+                TDLib Client identifier
+
+            data (``list[dict]``):
+                Requests to be sent
+        """
+
+        if client_id is None:
+            raise ValueError("client_id is required")
+
+        td_send = self._td_send
+        for request in [
+            json_dumps(request, encode=True, null_terminated=True) for request in data
+        ]:
+            td_send(client_id, request)
+
     def execute(self, data: dict) -> None | dict:
         """Executes a TDLib request
 
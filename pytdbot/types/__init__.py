@@ -1,5 +1,6 @@
 __all__ = [
     "TlObject",
+    "TL_TYPES",
     "Plugins",
     "ServerStats",
     "ScheduledEvent",
@@ -2334,6 +2335,7 @@ __all__ = [
 
 from .td_types import (
     TlObject,
+    TL_TYPES,
     AuthenticationCodeType,
     EmailAddressAuthentication,
     EmailAddressResetState,
@@ -6,6 +6,8 @@ import pytdbot
 
 
 class CallbackQueryBoundMethods:
+    __slots__ = ()
+
     def __init__(self):
         self._client: pytdbot.Client
 
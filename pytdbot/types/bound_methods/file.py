@@ -4,6 +4,8 @@ import pytdbot
 
 
 class FileBoundMethods:
+    __slots__ = ()
+
     def __init__(self):
         self._client: pytdbot.Client
 
@@ -9,6 +9,8 @@ from .chatActions import ChatActions
 
 
 class MessageBoundMethods:
+    __slots__ = ()
+
     def __init__(self):
         self._client: pytdbot.Client
 
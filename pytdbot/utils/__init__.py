@@ -1,5 +1,9 @@
 __all__ = [
     "MediaAlbumFuture",
+    "SendBatch",
+    "BroadcastResult",
+    "Metrics",
+    "Histogram",
     "escape_html",
     "escape_markdown",
     "JSON_ENCODER",
@@ -10,6 +14,10 @@ __all__ = [
     "json_loads",
     "load_callback_data",
     "dict_to_obj",
+    "ObjDecoder",
+    "ObjectCache",
+    "SendScheduler",
+    "TokenBucket",
     "obj_to_dict",
     "obj_to_json",
     "RETRY_AFTER_PREFEX",
@@ -17,6 +25,8 @@ __all__ = [
     "get_bot_id_from_token",
     "get_retry_after_time",
     "to_camel_case",
+    "parse_html",
+    "parse_markdown_v2",
     "rich_message_to_html",
     "anchor",
     "aside",
@@ -69,12 +79,16 @@ __all__ = [
     "spoiler",
     "strikethrough",
     "underline",
+    "UpdatesQueue",
+    "timeout_at",
+    "LanesQueue",
     "create_webapp_secret_key",
     "parse_webapp_data",
 ]
 
 
-from .albums import MediaAlbumFuture
+from .albums import MediaAlbumFuture, SendBatch
+from .broadcast import BroadcastResult
 from .escape import escape_html, escape_markdown
 from .json_utils import (
     JSON_ENCODER,
@@ -85,7 +99,10 @@ from .json_utils import (
     json_loads,
     load_callback_data,
 )
+from .metrics import Histogram, Metrics
+from .obj_decoder import ObjDecoder
 from .obj_encoder import dict_to_obj, obj_to_dict, obj_to_json
+from .object_cache import ObjectCache
 from .rich_converter import (
     rich_message_to_html,
 )
@@ -128,6 +145,7 @@ from .rich_messages import (
     unordered_list,
     video,
 )
+from .send_scheduler import SendScheduler, TokenBucket
 from .strings import (
     RETRY_AFTER_PREFEX,
     create_extra_id,
@@ -151,4 +169,7 @@ from .text_format import (
     strikethrough,
     underline,
 )
+from .text_parser import parse_html, parse_markdown_v2
+from .timeouts import timeout_at
+from .updates_queue import LanesQueue, UpdatesQueue
 from .webapps import create_webapp_secret_key, parse_webapp_data
@@ -3,15 +3,78 @@ from asyncio import Future
 from .. import types
 
 
-class MediaAlbumFuture(Future):
-    def __init__(self, messages: types.Messages):
+class SendBatch(Future):
+    r"""A future resolved when all the messages sent by a request (e.g. ``sendMessageAlbum`` or ``forwardMessages``) are sent or failed.
+    See :meth:`~pytdbot.Client.wait_messages_sent`
+
+    The result is :class:`~pytdbot.types.Messages` in the original order: sent messages, failed messages
+    (with :class:`~pytdbot.types.MessageSendingStateFailed`) and, if the batch expired, the messages still being sent
+
+    Parameters:
+        messages (:class:`~pytdbot.types.Messages` | ``list[Message]``):
+            The messages returned by the request
+    """
+
+    def __init__(self, messages: types.Messages | list[types.Message]):
         super().__init__()
-        self.messages = types.Messages(total_count=0, messages=[])
-        self.expected_count = messages.total_count
 
-    def set_result(self, result):
-        self.messages.messages.append(result)
-        self.messages.total_count += 1
+        if isinstance(messages, types.Messages):
+            messages = messages.messages
+
+        self.messages = [message for message in messages or () if message]
+        self.chat_ids = {message.chat_id for message in self.messages}
+        self.failed_count = 0
+        self.__pending = {
+            (message.chat_id, message.id): index
+            for index, message in enumerate(self.messages)
+            if isinstance(message.sending_state, types.MessageSendingStatePending)
+        }
+
+        if not self.__pending:
+            self.expire()
+
+    @property
+    def pending_count(self) -> int:
+        r"""Number of messages still being sent"""
+
+        return len(self.__pending)
+
+    @property
+    def pending(self) -> list[tuple[int, int]]:
+        r"""``(chat_id, message_id)`` of the messages still being sent"""
+
+        return list(self.__pending)
+
+    def resolve(
+        self,
+        chat_id: int,
+        message_id: int,
+        message: types.Message | None,
+        is_sent: bool,
+    ) -> bool:
+        r"""Set the final state of a message of the batch, ``message`` is ``None`` if it was deleted. Returns ``False`` if the message isn't part of the batch"""
+
+        index = self.__pending.pop((chat_id, message_id), None)
+        if index is None:
+            return False
+
+        if message is not None:
+            self.messages[index] = message
+        if not is_sent:
+            self.failed_count += 1
+
+        if not self.__pending:
+            self.expire()
+
+        return True
+
+    def expire(self) -> None:
+        r"""Resolve the batch now, with the current state of its messages"""
+
+        if not self.done():
+            self.set_result(
+                types.Messages(total_count=len(self.messages), messages=self.messages)
+            )
+
 
-        if self.messages.total_count == self.expected_count:
-            return super().set_result(self.messages)
+MediaAlbumFuture = SendBatch  # backward compatibility
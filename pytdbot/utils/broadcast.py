@@ -0,0 +1,41 @@
+from .. import types
+
+
+class BroadcastResult:
+    r"""Result of sending a broadcast message to a chat, see :meth:`~pytdbot.Client.broadcast`
+
+    Parameters:
+        index (``int``):
+            Position of the chat in ``chat_ids``
+
+        chat_id (``int``):
+            Chat identifier
+
+        result (:class:`~pytdbot.types.Message` | :class:`~pytdbot.types.Error`):
+            The sent message, or the error
+
+        checkpoint (``int``):
+            Number of chats from the start of ``chat_ids`` that are all done; pass it as ``start_index`` to resume the broadcast
+    """
+
+    __slots__ = ("index", "chat_id", "result", "checkpoint")
+
+    def __init__(
+        self, index: int, chat_id: int, result: types.TlObject, checkpoint: int
+    ) -> None:
+        self.index = index
+        self.chat_id = chat_id
+        self.result = result
+        self.checkpoint = checkpoint
+
+    @property
+    def ok(self) -> bool:
+        r"""Whether the message was sent"""
+
+        return not isinstance(self.result, types.Error)
+
+    def __str__(self) -> str:
+        return f"BroadcastResult(index={self.index}, chat_id={self.chat_id}, ok={self.ok}, checkpoint={self.checkpoint})"
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -1,3 +1,4 @@
+from base64 import b64encode
 from typing import Any
 
 try:
@@ -10,12 +11,24 @@ except ImportError:
 
 JSON_ENCODER = json.__name__
 
+
+def json_default(obj: Any) -> Any:
+    r"""Serialize TlObjects and bytes while dumping, without building the whole dict tree first"""
+
+    if isinstance(obj, bytes):
+        return b64encode(obj).decode("utf-8")
+    elif (to_dict := getattr(obj, "to_dict", None)) is not None:
+        return to_dict()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 if JSON_ENCODER == "orjson":
 
     def json_dumps(
         obj, encode: bool = False, null_terminated: bool = False
     ) -> str | bytes:
-        d = json.dumps(obj)
+        d = json.dumps(obj, default=json_default)
         if (
             null_terminated
         ):  # Null-terminated string is needed for orjson with c_char_p in tdjson
@@ -27,7 +40,7 @@ else:
     def json_dumps(
         obj, encode: bool = False, null_terminated: bool = False
     ) -> str | bytes:
-        d = json.dumps(obj, separators=(",", ":"))
+        d = json.dumps(obj, separators=(",", ":"), default=json_default)
         return d if not encode else d.encode("utf-8")
 
 
@@ -0,0 +1,263 @@
+from bisect import bisect_left
+from typing import Any
+
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Histogram:
+    r"""A latency histogram with fixed buckets
+
+    Parameters:
+        buckets (``tuple[float, ...]``, *optional*):
+            Sorted upper bounds of the buckets in seconds; an implicit ``+Inf`` bucket is added
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        r"""Estimate a quantile (e.g. ``0.99``) by linear interpolation inside its bucket. ``None`` if empty"""
+
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.buckets):  # +Inf bucket
+                    return self.buckets[-1]
+
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+
+        return self.buckets[-1]
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip((*self.buckets, float("inf")), self.counts):
+            cumulative += bucket_count
+            buckets[bound] = cumulative
+
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class HandlerMetrics:
+    r"""Metrics of a single handler, initializer or finalizer"""
+
+    __slots__ = (
+        "filter_time",
+        "handler_time",
+        "filtered_out",
+        "exceptions",
+        "timeouts",
+        "stop_handlers",
+    )
+
+    def __init__(self) -> None:
+        self.filter_time = Histogram()
+        self.handler_time = Histogram()
+        self.filtered_out = 0
+        self.exceptions = 0
+        self.timeouts = 0
+        self.stop_handlers = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.handler_time.count,
+            "filtered_out": self.filtered_out,
+            "exceptions": self.exceptions,
+            "timeouts": self.timeouts,
+            "stop_handlers": self.stop_handlers,
+            "filter_time": self.filter_time.snapshot(),
+            "handler_time": self.handler_time.snapshot(),
+        }
+
+
+class RequestMetrics:
+    r"""Metrics of a TDLib method"""
+
+    __slots__ = ("latency", "in_flight", "errors", "slow")
+
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.in_flight = 0
+        self.errors: dict[int, int] = {}
+        self.slow = 0
+
+    def observe_error(self, code: int) -> None:
+        self.errors[code] = self.errors.get(code, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "calls": self.latency.count,
+            "in_flight": self.in_flight,
+            "errors": dict(self.errors),
+            "slow": self.slow,
+            "latency": self.latency.snapshot(),
+        }
+
+
+class Metrics:
+    r"""Client metrics registry, see :meth:`~pytdbot.Client.metrics`"""
+
+    def __init__(self) -> None:
+        self.handlers: dict[Any, tuple[str, str, HandlerMetrics]] = {}
+        self.queue_wait: dict[str, Histogram] = {}
+        self.requests: dict[str, RequestMetrics] = {}
+
+    def get_handler(self, handler: Any) -> HandlerMetrics:
+        r"""Get the metrics of a :class:`~pytdbot.handlers.Handler`, created on first use"""
+
+        if (item := self.handlers.get(handler)) is None:
+            func = handler.func
+            item = self.handlers[handler] = (
+                handler.update_type,
+                f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}",
+                HandlerMetrics(),
+            )
+
+        return item[2]
+
+    def get_request(self, method: str) -> RequestMetrics:
+        r"""Get the metrics of a TDLib method, created on first use"""
+
+        if (request_metrics := self.requests.get(method)) is None:
+            request_metrics = self.requests[method] = RequestMetrics()
+
+        return request_metrics
+
+    def observe_queue_wait(self, update_type: str, value: float) -> None:
+        if (histogram := self.queue_wait.get(update_type)) is None:
+            histogram = self.queue_wait[update_type] = Histogram()
+
+        histogram.observe(value)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "handlers": [
+                {"update_type": update_type, "handler": name, **metrics.snapshot()}
+                for update_type, name, metrics in self.handlers.values()
+            ],
+            "queue_wait": {
+                update_type: histogram.snapshot()
+                for update_type, histogram in self.queue_wait.items()
+            },
+            "requests": {
+                method: request_metrics.snapshot()
+                for method, request_metrics in self.requests.items()
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "pytdbot") -> str:
+        r"""Render the metrics in Prometheus text exposition format"""
+
+        lines = []
+
+        def header(name: str, metric_type: str, description: str) -> str:
+            lines.append(f"# HELP {prefix}_{name} {description}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            return f"{prefix}_{name}"
+
+        handlers = [
+            (f'update_type="{update_type}",handler="{_escape(name)}"', metrics)
+            for update_type, name, metrics in self.handlers.values()
+        ]
+
+        for field, description in (
+            ("filtered_out", "Updates rejected by the handler filter"),
+            ("exceptions", "Exceptions raised by the handler"),
+            ("timeouts", "Handler timeouts"),
+            ("stop_handlers", "StopHandlers raised by the handler"),
+        ):
+            name = header(f"handler_{field}_total", "counter", description)
+            for labels, metrics in handlers:
+                lines.append(f"{name}{{{labels}}} {getattr(metrics, field)}")
+
+        for field, description in (
+            ("filter_time", "Handler filter time in seconds"),
+            ("handler_time", "Handler execution time in seconds"),
+        ):
+            name = header(f"handler_{field}_seconds", "histogram", description)
+            for labels, metrics in handlers:
+                _render_histogram(lines, name, labels, getattr(metrics, field))
+
+        name = header(
+            "queue_wait_seconds", "histogram", "Time updates waited in the queue"
+        )
+        for update_type, histogram in self.queue_wait.items():
+            _render_histogram(lines, name, f'update_type="{update_type}"', histogram)
+
+        name = header(
+            "request_latency_seconds", "histogram", "TDLib request round-trip time"
+        )
+        for method, request_metrics in self.requests.items():
+            _render_histogram(
+                lines, name, f'method="{method}"', request_metrics.latency
+            )
+
+        name = header("requests_in_flight", "gauge", "TDLib requests awaiting a result")
+        for method, request_metrics in self.requests.items():
+            lines.append(f'{name}{{method="{method}"}} {request_metrics.in_flight}')
+
+        name = header("request_errors_total", "counter", "TDLib errors by error code")
+        for method, request_metrics in self.requests.items():
+            for code, errors in request_metrics.errors.items():
+                lines.append(f'{name}{{method="{method}",code="{code}"}} {errors}')
+
+        name = header(
+            "slow_requests_total", "counter", "TDLib requests slower than the threshold"
+        )
+        for method, request_metrics in self.requests.items():
+            lines.append(f'{name}{{method="{method}"}} {request_metrics.slow}')
+
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _render_histogram(lines: list, name: str, labels: str, histogram: Histogram):
+    cumulative = 0
+    for bound, bucket_count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+        cumulative += bucket_count
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+
+    lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,85 @@
+import json
+from collections.abc import Callable
+from typing import Any
+
+from .json_utils import json_loads
+from .obj_encoder import get_obj_type
+
+TYPE_PREFIX = '{"@type":"'
+
+
+class ObjDecoder:
+    r"""Decode TDLib JSON straight into TlObjects in a single pass
+
+    Nested objects are built by the JSON parser object hook while parsing, so no intermediate dict tree is created.
+    The top-level object (which has ``@client_id``) is kept as ``dict`` to be routed by ``@client_id`` and ``@extra``;
+    convert it with :meth:`to_obj`. Not thread-safe, use one decoder per receiving thread.
+
+    Objects that can't be built, e.g. of a type missing from :mod:`pytdbot.types`, leave the whole JSON decoded as a plain ``dict``.
+
+    Parameters:
+        is_wanted (``Callable``, *optional*):
+            A function that takes the top-level ``@type`` and returns ``False`` if the objects are not needed.
+            In that case a plain ``dict`` is returned without objects. Default is ``None`` (always decode)
+    """
+
+    def __init__(self, is_wanted: Callable[[str], bool] | None = None) -> None:
+        self.is_wanted = is_wanted
+        self.__objects = []
+        self.__decoder = json.JSONDecoder(object_hook=self.__object_hook)
+
+    def decode(self, data: bytes | str) -> dict:
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+
+        if (
+            self.is_wanted is not None
+            and data.startswith(TYPE_PREFIX)
+            and not self.is_wanted(data[10 : data.find('"', 10)])
+        ):
+            return json_loads(data)
+
+        try:
+            return self.__decoder.decode(data)
+        except Exception:
+            # e.g. a type unknown to this version of pytdbot. Keep the plain dict,
+            # so only this update fails when it's converted instead of the receiver
+            return json_loads(data)
+        finally:
+            self.__objects = []
+
+    def __object_hook(self, data: dict) -> Any:
+        if "@client_id" in data:
+            data["@objects"] = self.__objects
+            return data
+        elif td_type := data.get("@type"):
+            obj = get_obj_type(td_type).from_dict(data)
+            self.__objects.append(obj)
+            return obj
+
+        return data
+
+    @staticmethod
+    def to_obj(data: dict, client: Any = None) -> Any:
+        r"""Build the top-level object of a decoded ``dict``
+
+        Parameters:
+            data (``dict``):
+                A ``dict`` returned by :meth:`decode`
+
+            client (:class:`~pytdbot.Client`, *optional*):
+                Client to bind to the objects
+
+        Returns:
+            :class:`~pytdbot.types.TlObject`
+        """
+
+        objects = data.pop("@objects")
+
+        obj = get_obj_type(data["@type"]).from_dict(data)
+        if client:
+            obj._client = client
+            for nested_obj in objects:
+                nested_obj._client = client
+
+        return obj
@@ -4,7 +4,8 @@ from typing import Any
 
 from .. import types, utils
 
-_type_cache: dict[str, type] = {}
+_type_cache: dict[str, type] = dict(types.TL_TYPES)
+_slots_cache: dict[type, frozenset] = {}
 
 
 def obj_to_json(obj: Any, **kwargs: Any) -> str:
@@ -24,13 +25,22 @@ def obj_to_dict(obj: Any) -> Any:
         return obj
 
 
-def dict_to_obj(dict_obj: Any, client: Any = None) -> Any:
+def get_obj_type(td_type: str) -> type:
+    obj_type = _type_cache.get(td_type)
+    if obj_type is None:
+        obj_type = getattr(types, utils.to_camel_case(td_type))
+        _type_cache[td_type] = obj_type
+
+    return obj_type
+
+
+def dict_to_obj(dict_obj: Any, client: Any = None, lazy: bool = False) -> Any:
     if isinstance(dict_obj, dict):
         if td_type := dict_obj.get("@type"):
-            obj_type = _type_cache.get(td_type)
-            if obj_type is None:
-                obj_type = getattr(types, utils.to_camel_case(td_type))
-                _type_cache[td_type] = obj_type
+            obj_type = get_obj_type(td_type)
+
+            if lazy:
+                return _lazy_dict_to_obj(obj_type, dict_obj, client)
 
             obj = obj_type.from_dict(
                 {key: dict_to_obj(value, client) for key, value in dict_obj.items()}
@@ -39,8 +49,40 @@ def dict_to_obj(dict_obj: Any, client: Any = None) -> Any:
                 obj._client = client
             return obj
         else:
-            return {key: dict_to_obj(value, client) for key, value in dict_obj.items()}
+            return {
+                key: dict_to_obj(value, client, lazy) for key, value in dict_obj.items()
+            }
     elif isinstance(dict_obj, list):
-        return [dict_to_obj(item, client) for item in dict_obj]
+        return [dict_to_obj(item, client, lazy) for item in dict_obj]
     else:
         return dict_obj
+
+
+def _lazy_dict_to_obj(obj_type: type, dict_obj: dict, client: Any = None) -> Any:
+    r"""Build only the top-level object; nested objects are kept raw in ``_lazy_fields``
+    and decoded on first access by ``TlObject.__getattr__``"""
+
+    obj = obj_type.from_dict(dict_obj)
+    fields = _slots_cache.get(obj_type)
+    if fields is None:
+        fields = _slots_cache[obj_type] = frozenset(obj_type.__slots__)
+
+    lazy_fields = None
+    for key, value in dict_obj.items():
+        if (
+            isinstance(value, dict)
+            or (
+                isinstance(value, list) and value and isinstance(value[0], (dict, list))
+            )
+        ) and key in fields:
+            if lazy_fields is None:
+                lazy_fields = {}
+
+            lazy_fields[key] = value
+            delattr(obj, key)
+
+    if lazy_fields is not None:
+        obj._lazy_fields = lazy_fields
+    if client:
+        obj._client = client
+    return obj
@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from time import monotonic
+from typing import Any
+
+
+class ObjectCache:
+    r"""A size-bounded LRU cache with optional time-to-live
+
+    Parameters:
+        maxsize (``int``, *optional*):
+            Max number of cached objects, the least recently used ones are evicted first. Default is ``10000``
+
+        ttl (``float``, *optional*):
+            Seconds after which a cached object expires. Default is ``None`` (never)
+
+        max_bytes (``int``, *optional*):
+            Max total size of the cached objects, as given to :meth:`set`. Default is ``None`` (unlimited)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self.__data: OrderedDict[Hashable, tuple[Any, float | None, int]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key) is not None
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        r"""Get a cached object and mark it as recently used"""
+
+        value = self.peek(key)
+        if value is None:
+            self.misses += 1
+            return default
+
+        self.__data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        r"""Get a cached object without affecting its LRU order or the hit statistics"""
+
+        item = self.__data.get(key)
+        if item is None:
+            return default
+
+        value, expires_at, size = item
+        if expires_at is not None and expires_at <= monotonic():
+            del self.__data[key]
+            self.bytes -= size
+            return default
+
+        return value
+
+    def set(self, key: Hashable, value: Any, size: int = 0) -> None:
+        r"""Cache an object of ``size`` bytes, evicting the least recently used objects if needed"""
+
+        self.pop(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self.__data[key] = (
+            value,
+            monotonic() + self.ttl if self.ttl is not None else None,
+            size,
+        )
+        self.bytes += size
+
+        while len(self.__data) > self.maxsize or (
+            self.max_bytes is not None and self.bytes > self.max_bytes
+        ):
+            self.bytes -= self.__data.popitem(last=False)[1][2]
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        item = self.__data.pop(key, None)
+        if item is None:
+            return default
+
+        self.bytes -= item[2]
+        return item[0]
+
+    def clear(self) -> None:
+        self.__data.clear()
+        self.bytes = 0
@@ -0,0 +1,248 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+from .. import types
+from .metrics import Histogram
+from .object_cache import ObjectCache
+
+# method: request field of the number of sent messages, if many
+RATE_LIMITED_METHODS = {
+    "sendMessage": None,
+    "sendMessageAlbum": "input_message_contents",
+    "forwardMessages": "message_ids",
+    "resendMessages": "message_ids",
+    "sendInlineQueryResultMessage": None,
+}
+
+
+class TokenBucket:
+    r"""A token bucket where tokens are reserved ahead: a reservation returns how long to wait before using it
+
+    Parameters:
+        rate (``float``):
+            Tokens added per second
+
+        capacity (``float``):
+            Max number of tokens, i.e. the allowed burst
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated_at", "pauses")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = monotonic()
+        self.pauses = 0
+
+    def reserve(self, cost: float = 1, now: float | None = None) -> float:
+        r"""Take ``cost`` tokens and get the seconds to wait before they are available"""
+
+        if now is None:
+            now = monotonic()
+
+        if now > self.updated_at:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated_at) * self.rate
+            )
+            self.updated_at = now
+
+        self.tokens -= cost
+        delay = self.updated_at - now
+        if self.tokens < 0:
+            delay += -self.tokens / self.rate
+
+        return max(delay, 0.0)
+
+    def refund(self, cost: float = 1) -> None:
+        r"""Give back ``cost`` tokens reserved since the last pause that won't be used"""
+
+        # a paused bucket still gives one token at a time when the pause ends
+        limit = self.capacity if self.updated_at <= monotonic() else 1.0
+        self.tokens = max(self.tokens, min(self.tokens + cost, limit))
+
+    def pause(self, until: float) -> None:
+        r"""Don't give tokens before ``until`` (:py:func:`time.monotonic` time), then give one token at a time.
+        Reservations made before are dropped and must be made again, see :attr:`pauses`"""
+
+        if until > self.updated_at:
+            self.updated_at = until
+            self.tokens = 1.0
+            self.pauses += 1
+
+
+class SendScheduler:
+    r"""Pace message sending to Telegram limits and retry flood waits
+
+    Every send waits for a token of its chat bucket, then for a token of the global bucket,
+    so a busy or flood-limited chat doesn't delay other chats. Requests failed with ``429 Too Many Requests``
+    pause their chat for the returned retry-after time and are sent again. See ``rate_limit`` of :class:`~pytdbot.Client`
+
+    Parameters:
+        global_rate (``float``, *optional*):
+            Max messages per second to all chats. Default is ``30``
+
+        private_chat_rate (``float``, *optional*):
+            Max messages per second to a private chat. Default is ``1``
+
+        private_chat_burst (``int``, *optional*):
+            Messages that can be sent at once to a private chat. Default is ``3``
+
+        group_chat_rate (``float``, *optional*):
+            Max messages per second to a group or channel. Default is ``20 / 60``
+
+        group_chat_burst (``int``, *optional*):
+            Messages that can be sent at once to a group or channel. Default is ``20``
+
+        max_retries (``int``, *optional*):
+            Max number of times a request is sent again after a flood wait. Default is ``3``
+
+        max_flood_wait (``float``, *optional*):
+            Max retry-after time in seconds to wait for; longer flood waits return the error. Default is ``60``
+
+        max_chats (``int``, *optional*):
+            Max number of chat buckets kept, the least recently used ones are dropped. Default is ``100000``
+    """
+
+    def __init__(
+        self,
+        global_rate: float = 30,
+        private_chat_rate: float = 1,
+        private_chat_burst: int = 3,
+        group_chat_rate: float = 20 / 60,
+        group_chat_burst: int = 20,
+        max_retries: int = 3,
+        max_flood_wait: float = 60,
+        max_chats: int = 100000,
+    ) -> None:
+        self.private_chat_rate = private_chat_rate
+        self.private_chat_burst = private_chat_burst
+        self.group_chat_rate = group_chat_rate
+        self.group_chat_burst = group_chat_burst
+        self.max_retries = max_retries
+        self.max_flood_wait = max_flood_wait
+
+        self.global_bucket = TokenBucket(global_rate, global_rate)
+        self.__chat_buckets = ObjectCache(max_chats)
+
+        self.queued = 0
+        self.delayed = 0
+        self.flood_waits = 0
+        self.retries = 0
+        self.delay = Histogram()
+
+    def get_bucket(self, chat_id: int) -> TokenBucket:
+        r"""Get the bucket of a chat, created on first use"""
+
+        if (bucket := self.__chat_buckets.peek(chat_id)) is None:
+            bucket = (
+                TokenBucket(self.group_chat_rate, self.group_chat_burst)
+                if chat_id < 0
+                else TokenBucket(self.private_chat_rate, self.private_chat_burst)
+            )
+
+        self.__chat_buckets.set(chat_id, bucket)
+        return bucket
+
+    async def acquire(self, chat_id: int, cost: int = 1) -> None:
+        r"""Wait until ``cost`` messages can be sent to ``chat_id``"""
+
+        bucket = self.get_bucket(chat_id)
+        global_delay = None
+
+        self.queued += 1
+        try:
+            delay = 0.0
+            while True:
+                pauses = bucket.pauses
+                chat_delay = bucket.reserve(cost)
+                delay += chat_delay
+                if chat_delay > 0:
+                    await asyncio.sleep(chat_delay)
+
+                if bucket.pauses == pauses:
+                    break
+                # the chat was paused by a flood wait meanwhile, which dropped the reservation
+
+            # reserved only once the chat is ready, so waiting chats don't hold global tokens
+            global_delay = self.global_bucket.reserve(cost)
+            if global_delay > 0:
+                await asyncio.sleep(global_delay)
+        except asyncio.CancelledError:
+            # the send won't happen, don't let it use the budget
+            if bucket.pauses == pauses:
+                bucket.refund(cost)
+            if global_delay is not None:
+                self.global_bucket.refund(cost)
+            raise
+        finally:
+            self.queued -= 1
+
+        delay += global_delay
+        if delay > 0:
+            self.delayed += 1
+        self.delay.observe(delay)
+
+    def on_flood_wait(self, chat_id: int, retry_after: float) -> None:
+        r"""Pause a chat for ``retry_after`` seconds"""
+
+        self.flood_waits += 1
+        self.get_bucket(chat_id).pause(monotonic() + retry_after)
+
+    def get_retry_after(self, error: types.Error, retries: int) -> int | None:
+        r"""Get the seconds to wait before sending again a request failed with ``error``, ``None`` if it shouldn't be retried"""
+
+        if not isinstance(error, types.Error) or error.code != 429:
+            return None
+
+        retry_after = error.limited_seconds
+        if retries >= self.max_retries or retry_after > self.max_flood_wait:
+            return None
+
+        return retry_after
+
+    async def run(
+        self,
+        chat_id: int,
+        send: Callable[[], Awaitable[types.TlObject]],
+        cost: int = 1,
+    ) -> types.TlObject:
+        r"""Call ``send`` when ``chat_id`` and the global limit allow sending ``cost`` messages, and again after flood waits"""
+
+        retries = 0
+        while True:
+            await self.acquire(chat_id, cost)
+            result = await send()
+
+            if (retry_after := self.get_retry_after(result, retries)) is None:
+                return result
+
+            self.on_flood_wait(chat_id, retry_after)
+            self.retries += 1
+            retries += 1
+
+    def get_cost(self, request: dict) -> int:
+        r"""Get the number of messages sent by ``request``"""
+
+        cost_field = RATE_LIMITED_METHODS[request["@type"]]
+        return max(len(request.get(cost_field) or ()), 1) if cost_field else 1
+
+    def is_limited(self, request: dict) -> bool:
+        r"""Whether ``request`` sends messages to a chat"""
+
+        return (
+            request.get("@type") in RATE_LIMITED_METHODS
+            and request.get("chat_id") is not None
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "queued": self.queued,
+            "delayed": self.delayed,
+            "flood_waits": self.flood_waits,
+            "retries": self.retries,
+            "chats": len(self.__chat_buckets),
+            "delay": self.delay.snapshot(),
+        }
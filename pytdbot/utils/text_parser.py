@@ -0,0 +1,501 @@
+import re
+
+from .. import types
+
+HTML_SPECIAL = re.compile(r"[<&]")
+HTML_ENTITIES = {"lt": "<", "gt": ">", "amp": "&", "quot": '"'}
+HTML_TAGS = {
+    "a": "text_url",
+    "b": "bold",
+    "strong": "bold",
+    "i": "italic",
+    "em": "italic",
+    "s": "strikethrough",
+    "strike": "strikethrough",
+    "del": "strikethrough",
+    "u": "underline",
+    "ins": "underline",
+    "tg-spoiler": "spoiler",
+    "span": "spoiler",
+    "pre": "pre",
+    "code": "code",
+    "blockquote": "blockquote",
+}
+
+MARKDOWN_SPECIAL = re.compile(r"[\\_*\[\]()~`>#+\-=|{}.!]")
+MARKDOWN_CODE_SPECIAL = re.compile(r"[\\`]")
+
+# characters TDLib removes or replaces, texts with them are parsed by TDLib
+UNSAFE_CHARACTERS = re.compile("[\\x00-\\x09\\x0b-\\x1f\\u202a-\\u202e\\u2066-\\u2069]")
+USER_URL = re.compile(r"tg://user\?id=([1-9]\d{0,12})", re.IGNORECASE)
+MAX_USER_ID = (1 << 40) - 1
+HTTP_URL = re.compile(
+    r"(https?)://([a-z0-9-]+(?:\.[a-z0-9-]+)+)(/[!-~]*)?", re.IGNORECASE
+)
+
+CODE_KINDS = {"code", "pre", "pre_code"}
+
+# same order as TDLib for entities with the same offset and length
+KIND_PRIORITIES = {
+    "blockquote": 0,
+    "pre_code": 10,
+    "pre": 11,
+    "code": 20,
+    "text_url": 49,
+    "mention_name": 49,
+    "bold": 90,
+    "italic": 91,
+    "underline": 92,
+    "strikethrough": 93,
+    "spoiler": 94,
+}
+
+
+def parse_html(text: str) -> types.FormattedText:
+    r"""Parse an HTML text into :class:`~pytdbot.types.FormattedText` locally, with the same rules as TDLib ``parseTextEntities``
+
+    Supported tags: ``b``, ``strong``, ``i``, ``em``, ``u``, ``ins``, ``s``, ``strike``, ``del``, ``tg-spoiler``,
+    ``span class="tg-spoiler"``, ``a``, ``code``, ``pre`` and ``blockquote``. Entity offsets are in UTF-16 code units
+
+    Parameters:
+        text (``str``):
+            The text to parse
+
+    Returns:
+        :class:`~pytdbot.types.FormattedText`
+
+    Raises:
+        :py:class:`ValueError`: If the text is invalid, or can't be parsed exactly like TDLib
+    """
+
+    _check_text(text)
+
+    s = text + "\0"
+    size = len(text)
+    parts = []
+    offset = 0
+    nested = []  # [tag name, argument, offset, parts index]
+    entities = []  # [kind, offset, length, argument]
+
+    i = 0
+    while True:
+        match = HTML_SPECIAL.search(text, i)
+        end = match.start() if match else size
+        if end > i:
+            chunk = text[i:end]
+            parts.append(chunk)
+            offset += _utf16_len(chunk)
+
+        if match is None:
+            break
+
+        i = end
+        if s[i] == "&":
+            character, i = _decode_html_entity(s, i)
+            parts.append(character)
+            offset += _utf16_len(character)
+            continue
+
+        begin = i
+        i += 1
+        if s[i] != "/":
+            while not _is_space(s[i]) and s[i] != ">":
+                i += 1
+            if s[i] == "\0":
+                raise ValueError(f"Unclosed start tag at offset {begin}")
+
+            tag_name = s[begin + 1 : i].lower()
+            if tag_name not in HTML_TAGS:
+                raise ValueError(f'Unsupported start tag "{tag_name}"')
+
+            argument = ""
+            while s[i] != ">":
+                while s[i] != "\0" and _is_space(s[i]):
+                    i += 1
+                if s[i] == ">":
+                    break
+
+                attribute_begin = i
+                while not _is_space(s[i]) and s[i] != "=":
+                    i += 1
+                attribute_name = s[attribute_begin:i]
+                if not attribute_name:
+                    raise ValueError(f'Empty attribute name in the tag "{tag_name}"')
+
+                while s[i] != "\0" and _is_space(s[i]):
+                    i += 1
+                if s[i] != "=":
+                    raise ValueError(f'Expected equal sign in the tag "{tag_name}"')
+
+                i += 1
+                while s[i] != "\0" and _is_space(s[i]):
+                    i += 1
+                if s[i] == "\0":
+                    raise ValueError(f"Unclosed start tag at offset {begin}")
+
+                value = []
+                if s[i] not in "'\"":
+                    while s[i].isascii() and (s[i].isalnum() or s[i] in ".-"):
+                        value.append(s[i])
+                        i += 1
+                    if not value:
+                        raise ValueError(f'Expected quote in the tag "{tag_name}"')
+                else:
+                    quote = s[i]
+                    i += 1
+                    while s[i] != quote and s[i] != "\0":
+                        if s[i] == "&":
+                            character, i = _decode_html_entity(s, i)
+                            value.append(character)
+                            continue
+                        value.append(s[i])
+                        i += 1
+                    if s[i] == quote:
+                        i += 1
+
+                if s[i] == "\0":
+                    raise ValueError(f"Unclosed start tag at offset {begin}")
+
+                value = "".join(value)
+                if tag_name == "a" and attribute_name == "href":
+                    argument = value
+                elif (
+                    tag_name == "code"
+                    and attribute_name == "class"
+                    and value.startswith("language-")
+                ):
+                    argument = value[9:]
+                elif (
+                    tag_name == "span"
+                    and attribute_name == "class"
+                    and value.startswith("tg-")
+                ):
+                    argument = value[3:]
+
+            if tag_name == "span" and argument != "spoiler":
+                raise ValueError('Tag "span" must have class "tg-spoiler"')
+
+            nested.append([tag_name, argument, offset, len(parts)])
+        else:
+            if not nested:
+                raise ValueError(f"Unexpected end tag at offset {begin}")
+
+            while not _is_space(s[i]) and s[i] != ">":
+                i += 1
+            end_tag_name = s[begin + 2 : i]
+            while s[i] != "\0" and _is_space(s[i]):
+                i += 1
+            if s[i] != ">":
+                raise ValueError(f"Unclosed end tag at offset {begin}")
+
+            tag_name, argument, entity_offset, parts_index = nested.pop()
+            if end_tag_name and end_tag_name.lower() != tag_name:
+                raise ValueError(f'Unmatched end tag, expected "</{tag_name}>"')
+
+            if offset > entity_offset:
+                length = offset - entity_offset
+                kind = HTML_TAGS[tag_name]
+
+                if kind == "text_url":
+                    kind, argument = _get_link(argument or "".join(parts[parts_index:]))
+                    entities.append([kind, entity_offset, length, argument])
+                elif kind == "pre":
+                    last = entities[-1] if entities else None
+                    if (
+                        last is not None
+                        and last[0] == "code"
+                        and last[1:3] == [entity_offset, length]
+                        and last[3]
+                    ):
+                        last[0] = "pre_code"
+                    else:
+                        entities.append(["pre", entity_offset, length, ""])
+                elif kind == "code":
+                    last = entities[-1] if entities else None
+                    if (
+                        last is not None
+                        and last[0] == "pre"
+                        and last[1:3] == [entity_offset, length]
+                        and argument
+                    ):
+                        last[0] = "pre_code"
+                        last[3] = argument
+                    else:
+                        entities.append(["code", entity_offset, length, argument])
+                else:
+                    entities.append([kind, entity_offset, length, ""])
+
+        i += 1
+
+    if nested:
+        raise ValueError(
+            f'Can\'t find end tag corresponding to start tag "{nested[-1][0]}"'
+        )
+
+    for entity in entities:
+        if entity[0] == "code":
+            entity[3] = ""
+
+    return _to_formatted_text("".join(parts), entities)
+
+
+def parse_markdown_v2(text: str) -> types.FormattedText:
+    r"""Parse a MarkdownV2 text into :class:`~pytdbot.types.FormattedText` locally, with the same rules as TDLib ``parseTextEntities``
+
+    Supported entities: bold, italic, underline, strikethrough, spoiler, code, pre and links. Entity offsets are in UTF-16 code units
+
+    Parameters:
+        text (``str``):
+            The text to parse
+
+    Returns:
+        :class:`~pytdbot.types.FormattedText`
+
+    Raises:
+        :py:class:`ValueError`: If the text is invalid, or can't be parsed exactly like TDLib
+    """
+
+    _check_text(text)
+
+    s = text + "\0\0\0"
+    size = len(text)
+    parts = []
+    offset = 0
+    nested = []  # [kind, argument, offset, parts index]
+    entities = []
+
+    i = 0
+    while i < size:
+        special = (
+            MARKDOWN_CODE_SPECIAL
+            if nested and nested[-1][0] in CODE_KINDS
+            else MARKDOWN_SPECIAL
+        )
+        match = special.search(text, i)
+        end = match.start() if match else size
+        if end > i:
+            chunk = text[i:end]
+            parts.append(chunk)
+            offset += _utf16_len(chunk)
+
+        if match is None:
+            break
+
+        i = end
+        c = s[i]
+        if c == "\\":
+            if "\x01" <= s[i + 1] <= "\x7e":
+                i += 1
+            parts.append(s[i])
+            offset += 1
+            i += 1
+            continue
+
+        kind = nested[-1][0] if nested else None
+        if kind == "bold":
+            is_end = c == "*"
+        elif kind == "italic":
+            is_end = c == "_" and s[i + 1] != "_"
+        elif kind == "underline":
+            is_end = c == "_" and s[i + 1] == "_"
+        elif kind == "strikethrough":
+            is_end = c == "~"
+        elif kind == "spoiler":
+            is_end = c == "|" and s[i + 1] == "|"
+        elif kind == "code":
+            is_end = c == "`"
+        elif kind in ("pre", "pre_code"):
+            is_end = s[i : i + 3] == "```"
+        elif kind == "text_url":
+            is_end = c == "]"
+        else:
+            is_end = False
+
+        if not is_end:
+            argument = ""
+            if c == "_":
+                if s[i + 1] == "_":
+                    kind = "underline"
+                    i += 1
+                else:
+                    kind = "italic"
+            elif c == "*":
+                kind = "bold"
+            elif c == "~":
+                kind = "strikethrough"
+            elif c == "|" and s[i + 1] == "|":
+                kind = "spoiler"
+                i += 1
+            elif c == "[":
+                kind = "text_url"
+            elif c == "`":
+                if s[i : i + 3] == "```":
+                    i += 3
+                    kind = "pre"
+                    language_end = i
+                    while not _is_space(s[language_end]) and s[language_end] != "`":
+                        language_end += 1
+                    if (
+                        i != language_end
+                        and language_end < size
+                        and s[language_end] != "`"
+                    ):
+                        kind = "pre_code"
+                        argument = s[i:language_end]
+                        i = language_end
+
+                    if s[i] == "\n":  # skip one new line in the beginning of the text
+                        i += 1
+                    i -= 1
+                else:
+                    kind = "code"
+            else:  # also blockquotes and custom emoji, left to TDLib
+                raise ValueError(f"Character '{c}' is reserved and must be escaped")
+
+            nested.append([kind, argument, offset, len(parts)])
+        else:
+            kind, argument, entity_offset, parts_index = nested.pop()
+            skip = offset == entity_offset
+
+            if kind in ("underline", "spoiler"):
+                i += 1
+            elif kind in ("pre", "pre_code"):
+                i += 2
+            elif kind == "text_url":
+                if s[i + 1] != "(":
+                    url = "".join(parts[parts_index:])
+                else:
+                    i += 2
+                    url = []
+                    while i < size and s[i] != ")":
+                        if s[i] == "\\" and "\x01" <= s[i + 1] <= "\x7e":
+                            url.append(s[i + 1])
+                            i += 2
+                            continue
+                        url.append(s[i])
+                        i += 1
+                    if s[i] != ")":
+                        raise ValueError("Can't find end of a URL")
+                    url = "".join(url)
+
+                kind, argument = _get_link(url)
+
+            if not skip:
+                entities.append([kind, entity_offset, offset - entity_offset, argument])
+
+        i += 1
+
+    if nested:
+        raise ValueError(f"Can't find end of {nested[-1][0]} entity")
+
+    return _to_formatted_text("".join(parts), entities)
+
+
+def _check_text(text: str) -> None:
+    if not isinstance(text, str):
+        raise TypeError("text must be str")
+
+    if UNSAFE_CHARACTERS.search(text):
+        raise ValueError("Text contains characters cleaned by TDLib")
+
+
+def _is_space(c: str) -> bool:
+    return c in " \t\r\n\0\v"
+
+
+def _utf16_len(text: str) -> int:
+    return len(text) if text.isascii() else len(text.encode("utf-16-le")) // 2
+
+
+def _decode_html_entity(s: str, pos: int) -> tuple[str, int]:
+    r"""Decode the HTML entity at ``pos`` like TDLib: the ``;`` is optional and unknown entities are kept as is"""
+
+    end = pos + 1
+    if s[end] == "#":
+        end += 1
+        if s[end] == "x":
+            end += 1
+            digits_begin = end
+            while s[end] in "0123456789abcdefABCDEF":
+                end += 1
+            code = int(s[digits_begin:end], 16) if end > digits_begin else 0
+        else:
+            digits_begin = end
+            while s[end].isascii() and s[end].isdigit():
+                end += 1
+            code = int(s[digits_begin:end]) if end > digits_begin else 0
+
+        if code == 0 or code >= 0x10FFFF or end - pos >= 10:
+            return "&", pos + 1
+        elif 0xD800 <= code <= 0xDFFF:
+            raise ValueError("Invalid character reference")
+
+        character = chr(code)
+        if UNSAFE_CHARACTERS.match(character):
+            raise ValueError("Text contains characters cleaned by TDLib")
+    else:
+        while s[end].isascii() and s[end].isalpha():
+            end += 1
+        character = HTML_ENTITIES.get(s[pos + 1 : end])
+        if character is None:
+            return "&", pos + 1
+
+    return character, end + 1 if s[end] == ";" else end
+
+
+def _get_link(url: str) -> tuple[str, str | int]:
+    r"""Get the entity kind and argument of a link, normalized like TDLib. Other links are left to TDLib"""
+
+    if (match := USER_URL.fullmatch(url)) and int(match.group(1)) <= MAX_USER_ID:
+        return "mention_name", int(match.group(1))
+    elif match := HTTP_URL.fullmatch(url):
+        scheme, host, path = match.groups()
+        return "text_url", f"{scheme.lower()}://{host.lower()}{path or '/'}"
+
+    raise ValueError("Link is checked by TDLib")
+
+
+def _to_formatted_text(text: str, entities: list[list]) -> types.FormattedText:
+    if not entities:
+        return types.FormattedText(text=text, entities=[])
+
+    entities.sort(
+        key=lambda entity: (entity[1], -entity[2], KIND_PRIORITIES[entity[0]])
+    )
+
+    return types.FormattedText(
+        text=text,
+        entities=[
+            types.TextEntity(
+                offset=offset, length=length, type=_get_entity_type(kind, argument)
+            )
+            for kind, offset, length, argument in entities
+        ],
+    )
+
+
+def _get_entity_type(kind: str, argument: str | int) -> types.TextEntityType:
+    if kind == "bold":
+        return types.TextEntityTypeBold()
+    elif kind == "italic":
+        return types.TextEntityTypeItalic()
+    elif kind == "underline":
+        return types.TextEntityTypeUnderline()
+    elif kind == "strikethrough":
+        return types.TextEntityTypeStrikethrough()
+    elif kind == "spoiler":
+        return types.TextEntityTypeSpoiler()
+    elif kind == "code":
+        return types.TextEntityTypeCode()
+    elif kind == "pre":
+        return types.TextEntityTypePre()
+    elif kind == "pre_code":
+        return types.TextEntityTypePreCode(language=argument)
+    elif kind == "text_url":
+        return types.TextEntityTypeTextUrl(url=argument)
+    elif kind == "mention_name":
+        return types.TextEntityTypeMentionName(user_id=argument)
+    elif kind == "blockquote":
+        return types.TextEntityTypeBlockQuote()
+
+    raise ValueError(f"Unknown entity kind {kind}")
@@ -0,0 +1,47 @@
+import asyncio
+import sys
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout_at
+else:
+
+    class timeout_at:
+        r"""Minimal :py:func:`asyncio.timeout_at` for Python 3.10
+
+        Cancels the current task at ``when`` (loop time) and raises :py:class:`asyncio.TimeoutError` instead of
+        :py:class:`asyncio.CancelledError`. Only a timer is scheduled, no extra task is created
+        """
+
+        __slots__ = ("when", "__handle", "__task", "__expired")
+
+        def __init__(self, when: float | None) -> None:
+            self.when = when
+            self.__handle = None
+            self.__task = None
+            self.__expired = False
+
+        async def __aenter__(self) -> "timeout_at":
+            if self.when is not None:
+                self.__task = asyncio.current_task()
+                self.__handle = asyncio.get_running_loop().call_at(
+                    self.when, self.__on_timeout
+                )
+
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb) -> bool | None:
+            if self.__handle is not None:
+                self.__handle.cancel()
+                self.__handle = None
+
+            if self.__expired and exc_type is asyncio.CancelledError:
+                raise asyncio.TimeoutError from exc
+
+            return None
+
+        def expired(self) -> bool:
+            return self.__expired
+
+        def __on_timeout(self) -> None:
+            self.__task.cancel()
+            self.__expired = True
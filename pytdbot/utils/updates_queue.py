@@ -0,0 +1,264 @@
+from asyncio import Queue
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from heapq import merge
+from itertools import count
+from time import perf_counter
+from typing import Any, NamedTuple
+
+OVERFLOW_POLICIES = {"block", "drop_oldest", "drop_newest", "drop_by_type"}
+
+
+class _Entry(NamedTuple):
+    put_time: float | None
+    item: Any
+
+
+class UpdatesQueue(Queue):
+    r"""A bounded updates queue with selectable overflow policy
+
+    Updates are received as ``(put_time, update)``, where ``put_time`` is the :py:func:`time.perf_counter` time
+    the update was put (or the time given to :meth:`put`), or ``None`` if ``track_wait_time`` is ``False``
+
+    Parameters:
+        maxsize (``int``, *optional*):
+            Max number of queued updates. If ``0`` or less, the queue is unbounded. Default is ``0``
+
+        overflow (``str``, *optional*):
+            What to do when the queue is full. Default is ``block``
+            Supported values: ``block`` (wait for a free slot), ``drop_oldest``, ``drop_newest``, ``drop_by_type`` (shed queued or incoming updates by ``shed_types``, else wait)
+
+        shed_types (``list[str]``, *optional*):
+            Update types that can be dropped when ``overflow`` is ``drop_by_type``, the first ones are dropped first
+
+        track_wait_time (``bool``, *optional*):
+            Whether to record when updates are put. Default is ``False``
+
+    Raises:
+        :py:class:`ValueError`
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: str = "block",
+        shed_types: list[str] | None = None,
+        track_wait_time: bool = False,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of: {', '.join(sorted(OVERFLOW_POLICIES))}"
+            )
+
+        super().__init__(maxsize if isinstance(maxsize, int) else 0)
+
+        self.overflow = overflow
+        self.shed_types = {
+            update_type: rank for rank, update_type in enumerate(shed_types or ())
+        }
+        self.dropped_count = 0
+        self.dropped_types: dict[str, int] = {}
+        self.track_wait_time = track_wait_time
+
+    async def put(self, item: Any, put_time: float | None = None) -> None:
+        r"""Put an update, waiting for a free slot if needed. ``put_time`` is when the update arrived, default is now"""
+
+        if self.full() and self.overflow != "block" and self.__shed(item):
+            return
+
+        await super().put(_Entry(self.__get_put_time(put_time), item))
+
+    def put_nowait(self, item: Any, put_time: float | None = None) -> None:
+        r"""Put an update without waiting. ``put_time`` is when the update arrived, default is now"""
+
+        if isinstance(item, _Entry):  # from put, which already waited for a free slot
+            super().put_nowait(item)
+            return
+
+        if self.full() and self.overflow != "block" and self.__shed(item):
+            return
+
+        super().put_nowait(_Entry(self.__get_put_time(put_time), item))
+
+    def __get_put_time(self, put_time: float | None) -> float | None:
+        if not self.track_wait_time:
+            return None
+
+        return perf_counter() if put_time is None else put_time
+
+    def release(self, item: Any) -> None:
+        r"""Mark a received update as handled"""
+
+    def _items(self) -> Iterable[Any]:
+        return (item for _, item in self._queue)
+
+    def _pop_oldest(self) -> Any:
+        return self._queue.popleft()[1]
+
+    def _remove(self, item: Any) -> None:
+        for i, (_, queued) in enumerate(self._queue):
+            if queued is item:
+                del self._queue[i]
+                break
+
+    def __shed(self, item: Any) -> bool:
+        r"""Make room for ``item``. Returns ``True`` if ``item`` itself was dropped"""
+
+        if self.overflow == "drop_newest":
+            self.__count_dropped(item)
+            return True
+        elif self.overflow == "drop_oldest":
+            self.__count_dropped(self._pop_oldest())
+            return False
+
+        item_rank = self.shed_types.get(item.getType())
+        candidate = None
+        rank = None
+        for queued in self._items():
+            queued_rank = self.shed_types.get(queued.getType())
+            if queued_rank is not None and (rank is None or queued_rank < rank):
+                candidate, rank = queued, queued_rank
+                if rank == 0:
+                    break
+
+        if candidate is not None and (item_rank is None or rank <= item_rank):
+            self._remove(candidate)
+            self.__count_dropped(candidate)
+            return False
+        elif item_rank is not None:
+            self.__count_dropped(item)
+            return True
+
+        return False  # Nothing to shed, fallback to block (or QueueFull)
+
+    def __count_dropped(self, item: Any) -> None:
+        update_type = item.getType()
+
+        self.dropped_count += 1
+        self.dropped_types[update_type] = self.dropped_types.get(update_type, 0) + 1
+
+
+class LanesQueue(UpdatesQueue):
+    r"""An :class:`~pytdbot.utils.UpdatesQueue` that keeps updates with the same key strictly ordered
+
+    Every key (e.g. chat ID) gets its own lane. A lane is handed to one consumer at a time
+    and is not available again until :meth:`release` is called for the received update.
+    Ready lanes are served round-robin, one update each, so a busy key can't starve the others.
+    Updates with ``None`` key are not ordered.
+
+    Parameters:
+        key (``Callable``):
+            A function that returns the lane key of an update
+
+        maxsize (``int``, *optional*):
+            Max number of queued updates. If ``0`` or less, the queue is unbounded. Default is ``0``
+
+        overflow (``str``, *optional*):
+            What to do when the queue is full. Default is ``block``
+
+        shed_types (``list[str]``, *optional*):
+            Update types that can be dropped when ``overflow`` is ``drop_by_type``, the first ones are dropped first
+
+        track_wait_time (``bool``, *optional*):
+            Whether to record when updates are put. Default is ``False``
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Any], Hashable],
+        maxsize: int = 0,
+        overflow: str = "block",
+        shed_types: list[str] | None = None,
+        track_wait_time: bool = False,
+    ) -> None:
+        super().__init__(maxsize, overflow, shed_types, track_wait_time)
+
+        self.key = key
+
+    def _init(self, maxsize: int) -> None:
+        self._lanes: dict[Hashable, deque] = {}
+        self._ready: deque = deque()
+        self._busy: set = set()
+        self._size = 0
+        self._counter = count()
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return not self._ready
+
+    def _put(self, entry: _Entry) -> None:
+        key = self.key(entry.item)
+
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = deque()
+
+        lane.append((next(self._counter), entry))
+        self._size += 1
+
+        if len(lane) == 1 and key not in self._busy:
+            self._ready.append(key)
+
+    def _get(self) -> _Entry:
+        key = self._ready.popleft()
+        lane = self._lanes[key]
+        _, entry = lane.popleft()
+        self._size -= 1
+
+        if key is None:
+            if lane:
+                self._ready.append(key)
+            else:
+                del self._lanes[key]
+        else:
+            self._busy.add(key)
+
+        return entry
+
+    def release(self, item: Any) -> None:
+        r"""Mark a received update as handled, so the next update of its lane can be received"""
+
+        key = self.key(item)
+        if key is None or key not in self._busy:
+            return
+
+        self._busy.discard(key)
+
+        if self._lanes[key]:
+            self._ready.append(key)
+            self._wakeup_next(self._getters)
+        else:
+            del self._lanes[key]
+
+    def _items(self) -> Iterable[Any]:
+        return (entry.item for _, entry in merge(*self._lanes.values()))
+
+    def _pop_oldest(self) -> Any:
+        key = min(
+            (key for key, lane in self._lanes.items() if lane),
+            key=lambda k: self._lanes[k][0][0],
+        )
+        _, entry = self._lanes[key].popleft()
+        self._after_remove(key)
+
+        return entry.item
+
+    def _remove(self, item: Any) -> None:
+        key = self.key(item)
+        lane = self._lanes[key]
+
+        for i, (_, entry) in enumerate(lane):
+            if entry.item is item:
+                del lane[i]
+                break
+
+        self._after_remove(key)
+
+    def _after_remove(self, key: Hashable) -> None:
+        self._size -= 1
+
+        if not self._lanes[key] and key not in self._busy:
+            self._ready.remove(key)
+            del self._lanes[key]
@@ -0,0 +1,84 @@
+"""Parity of the local HTML and MarkdownV2 parsers with TDLib ``parseTextEntities``
+
+``expected`` of every case of ``fixtures/text_parser_corpus.json`` is the ``parseTextEntities`` result of the TDLib version
+recorded in the file, ``formattedText`` or ``error``. The local parser must return the same ``formattedText``, or raise
+:py:class:`ValueError` for errors and for cases marked ``left_to_tdlib``, which it doesn't parse on its own.
+
+The expected results are generated with TDLib, which needs the `tdjson <https://github.com/AYMENJD/tdjson>`_ binding::
+
+    python tests/test_text_parser.py
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from pytdbot.utils import obj_to_dict, parse_html, parse_markdown_v2
+
+CORPUS_PATH = Path(__file__).parent / "fixtures" / "text_parser_corpus.json"
+PARSERS = {"HTML": parse_html, "MarkdownV2": parse_markdown_v2}
+PARSE_MODES = {
+    "HTML": {"@type": "textParseModeHTML"},
+    "MarkdownV2": {"@type": "textParseModeMarkdown", "version": 2},
+}
+
+with open(CORPUS_PATH, encoding="utf-8") as f:
+    CORPUS = json.load(f)
+
+CASES = CORPUS["cases"]
+
+
+def parse_with_tdlib(td, case: dict) -> dict:
+    result = td.execute(
+        {
+            "@type": "parseTextEntities",
+            "text": case["text"],
+            "parse_mode": PARSE_MODES[case["parse_mode"]],
+        }
+    )
+    result.pop("@extra", None)
+
+    return result
+
+
+@pytest.fixture(scope="module")
+def td():
+    pytest.importorskip("tdjson")
+    from pytdbot.tdjson import TdJson
+
+    return TdJson(verbosity=0)
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case["name"] for case in CASES])
+def test_local_parser(case):
+    parse = PARSERS[case["parse_mode"]]
+
+    if case["expected"]["@type"] == "error" or case.get("left_to_tdlib"):
+        with pytest.raises(ValueError):
+            parse(case["text"])
+    else:
+        assert obj_to_dict(parse(case["text"])) == case["expected"]
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case["name"] for case in CASES])
+def test_corpus_matches_tdlib(td, case):
+    if td.version != CORPUS["tdlib"]["version"]:
+        pytest.skip(
+            f"corpus is generated with TDLib {CORPUS['tdlib']['version']}, not {td.version}"
+        )
+
+    assert parse_with_tdlib(td, case) == case["expected"]
+
+
+if __name__ == "__main__":
+    from pytdbot.tdjson import TdJson
+
+    td = TdJson(verbosity=0)
+    CORPUS["tdlib"] = {"version": td.version, "commit_hash": td.commit_hash}
+    for case in CASES:
+        case["expected"] = parse_with_tdlib(td, case)
+
+    with open(CORPUS_PATH, "w", encoding="utf-8") as f:
+        json.dump(CORPUS, f, ensure_ascii=False, indent=4)
+        f.write("\n")